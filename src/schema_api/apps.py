@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class SchemaApiConfig(AppConfig):
+    name = "schema_api"
+
+    def ready(self):
+        # Connect the receivers that keep the stored dataset documents up to date
+        from . import signals  # noqa: F401
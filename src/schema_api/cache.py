@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from django.conf import settings
+from schematools.types import DatasetSchema
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    size: int
+
+
+class DatasetSchemaCache:
+    """
+    LRU cache of parsed DatasetSchema objects, local to the (uwsgi) worker process.
+
+    Entries are stored per dataset name together with the content hash of the dataset.
+    A lookup with a different content hash is a miss, so updated datasets are parsed again.
+    The size of an entry is the length of its schema_data, which is used to bound the
+    memory that the cache can take.
+    """
+
+    def __init__(self, max_entries: int, max_size: int):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._entries: OrderedDict[str, tuple[str, DatasetSchema, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name: str, content_hash: str) -> DatasetSchema | None:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry[0] != content_hash:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(name)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, name: str, content_hash: str, schema: DatasetSchema, size: int) -> None:
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            self._remove(name)
+            self._entries[name] = (content_hash, schema, size)
+            self._size += size
+
+            # Evict the least recently used entries
+            while len(self._entries) > self.max_entries or self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, len(self._entries), self._size)
+
+    def _remove(self, name: str) -> None:
+        if (entry := self._entries.pop(name, None)) is not None:
+            self._size -= entry[2]
+
+
+dataset_schema_cache = DatasetSchemaCache(
+    max_entries=settings.DATASET_SCHEMA_CACHE_MAX_ENTRIES,
+    max_size=settings.DATASET_SCHEMA_CACHE_MAX_SIZE,
+)
+
+
+def filter_signature(tables: list[str] | None, scopes: list[str] | None) -> str:
+    """
+    Canonical form of the table and scope filters of a request.
+
+    The tables and scopes are reduced to sorted sets, so the order in the query string
+    does not matter. OPENBAAR is always added by DatasetSchema.filter_on_scopes,
+    so it is added here as well.
+    """
+    if scopes:
+        scopes = {*scopes, "OPENBAAR"}
+    return json.dumps([sorted(set(tables or ())), sorted(set(scopes or ()))])
+
+
+def filtered_schema_cache_key(
+    name: str, content_hash: str, tables: list[str] | None, scopes: list[str] | None
+) -> str:
+    """Key in the Django cache for a dataset schema filtered on tables and/or scopes"""
+    digest = hashlib.sha256(filter_signature(tables, scopes).encode()).hexdigest()
+    return f"schema_api:filtered:{name}:{content_hash}:{digest}"
+
+
+def changelog_aggregates_cache_key(last_id: int | None, query_string: str) -> str:
+    """
+    Key in the Django cache for changelog aggregates. The changelog command
+    only adds items, so the highest id changes the key with each ingestion.
+    """
+    digest = hashlib.sha256(query_string.encode()).hexdigest()
+    return f"schema_api:changelog_aggregates:{last_id}:{digest}"
@@ -0,0 +1,134 @@
+"""
+Notifications about new changelog items, which wake up the changelog feed.
+
+The broker is configured with the CHANGELOG_FEED_BROKER setting. PostgresBroker
+uses LISTEN/NOTIFY, so the changelog command and the web workers only need
+the database to find each other. LocalBroker only works within one process,
+which is enough for tests.
+
+Every open feed holds a worker thread and a listening database connection,
+so the number of feeds per process is capped by CHANGELOG_FEED_MAX_CONNECTIONS.
+"""
+
+import threading
+from functools import cache
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+
+CHANNEL = "schema_api_changelog"
+
+
+class PostgresBroker:
+    def notify(self):
+        # Postgres delivers the notification when the transaction commits,
+        # and multiple notifications in one transaction are combined.
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, '')", [CHANNEL])
+
+    def listen(self) -> "PostgresListener":
+        return PostgresListener()
+
+
+class PostgresListener:
+    """
+    Listens on a separate connection, so the Django connection is free
+    for querying the new items.
+    """
+
+    def __enter__(self):
+        self.connection = connection.get_new_connection(connection.get_connection_params())
+        self.connection.autocommit = True
+        self.connection.execute(f"LISTEN {CHANNEL}")
+        return self
+
+    def __exit__(self, *exc_info):
+        self.connection.close()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for a notification, returns False when the timeout expired first"""
+        return any(True for _ in self.connection.notifies(timeout=timeout, stop_after=1))
+
+
+class LocalBroker:
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.counter = 0
+
+    def notify(self):
+        transaction.on_commit(self.publish)
+
+    def publish(self):
+        with self.condition:
+            self.counter += 1
+            self.condition.notify_all()
+
+    def listen(self) -> "LocalListener":
+        return LocalListener(self)
+
+
+class LocalListener:
+    def __init__(self, broker: LocalBroker):
+        self.broker = broker
+
+    def __enter__(self):
+        self.seen = self.broker.counter
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for a notification, returns False when the timeout expired first"""
+        with self.broker.condition:
+            notified = self.broker.condition.wait_for(
+                lambda: self.broker.counter != self.seen, timeout
+            )
+            self.seen = self.broker.counter
+        return notified
+
+
+class ConnectionLimit:
+    """Counts the open feeds of this process, no new feeds are accepted at the limit"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def acquire(self) -> bool:
+        with self.lock:
+            if self.count >= settings.CHANGELOG_FEED_MAX_CONNECTIONS:
+                return False
+            self.count += 1
+            return True
+
+    def release(self):
+        with self.lock:
+            self.count -= 1
+
+
+class FeedStream:
+    """
+    The events of an accepted feed. The WSGI server closes the response when it's done,
+    also when the stream was never started, which gives the connection back to the limit.
+    """
+
+    def __init__(self, events, limit: ConnectionLimit):
+        self.events = events
+        self.limit = limit
+
+    def __iter__(self):
+        return self.events
+
+    def close(self):
+        self.events.close()
+        self.limit.release()
+
+
+feed_connections = ConnectionLimit()
+
+
+@cache
+def get_broker():
+    return import_string(settings.CHANGELOG_FEED_BROKER)()
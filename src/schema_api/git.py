@@ -0,0 +1,218 @@
+"""
+Reading Amsterdam Schema files straight from the git object store,
+so the changelog command doesn't have to check out every commit.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+
+from schematools.exceptions import SchemaObjectNotFound
+from schematools.loaders import _FileBasedSchemaLoader
+
+DATASETS_DIR = "datasets"
+
+
+class GitRepository:
+    """
+    A git repository, read with git plumbing commands.
+
+    File contents are streamed through a single ``git cat-file --batch`` process,
+    which is started on first use and kept running until close().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._cat_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._cat_file is not None:
+            self._cat_file.stdin.close()
+            self._cat_file.wait()
+            self._cat_file = None
+
+    def run(self, *args) -> str:
+        return subprocess.run(  # noqa: S603
+            ["git", "-C", str(self.path), *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    def commit_time(self, commit: str) -> datetime:
+        """The time the commit was made (the committer date)"""
+        timestamp = self.run("show", "-s", "--format=%ct", commit).strip()
+        return datetime.fromtimestamp(int(timestamp), tz=UTC)
+
+    def commits_between(self, start_commit: str, end_commit: str) -> list[str]:
+        """
+        The commits from the start up to and including the end commit, oldest first.
+        Only the first parents are followed, like the history of the main branch.
+        """
+        # Excluding all parents of the start commit also works for the very first commit
+        return self.run(
+            "rev-list", "--first-parent", "--reverse", end_commit, f"^{start_commit}^@"
+        ).splitlines()
+
+    def tree_ids(self, commit: str, paths: list[str]) -> list[str]:
+        """The object ids of the folders in the commit, these only change with their contents"""
+        if not paths:
+            return []
+        return self.run("rev-parse", *(f"{commit}:{path}" for path in paths)).splitlines()
+
+    def existing_files(self, commit: str, paths: list[str]) -> list[str]:
+        """The paths that exist as a file in the commit"""
+        if not paths:
+            return []
+        return self.run("ls-tree", "--name-only", commit, "--", *paths).splitlines()
+
+    def changed_files(self, base_commit: str, update_commit: str, path: str) -> list[str]:
+        """Files below the path that were added, changed or removed between the commits"""
+        return self.run(
+            "diff", "--name-only", "--no-renames", base_commit, update_commit, "--", path
+        ).splitlines()
+
+    def read_file(self, commit: str, path: str) -> bytes | None:
+        """Contents of a file in the commit, None when it doesn't exist"""
+        if self._cat_file is None:
+            self._cat_file = subprocess.Popen(  # noqa: S603
+                ["git", "-C", str(self.path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+
+        self._cat_file.stdin.write(f"{commit}:{path}\n".encode())
+        self._cat_file.stdin.flush()
+
+        # Either "<object> <type> <size>" followed by the contents, or "<name> missing"
+        header = self._cat_file.stdout.readline().split()
+        if header[-1] == b"missing":
+            return None
+
+        contents = self._cat_file.stdout.read(int(header[2]))
+        self._cat_file.stdout.read(1)  # newline after the contents
+        return contents
+
+
+def update_mirror(url: str, path) -> None:
+    """
+    Bring the bare mirror of the repository at the path up to date.
+    It is cloned on first use, after that only the new objects are fetched.
+    """
+    if not Path(path, "HEAD").exists():
+        subprocess.run(  # noqa: S603
+            ["git", "clone", "--quiet", "--mirror", url, str(path)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return
+
+    repository = GitRepository(path)
+    repository.run("remote", "set-url", "origin", url)
+    repository.run("fetch", "--quiet", "--prune", "origin")
+
+
+def find_dataset_dirs(files: list[str]) -> set[str]:
+    """The dataset folders, being the folders with a dataset.json, of a list of files"""
+    return {
+        str(PurePosixPath(file).parent)
+        for file in files
+        if PurePosixPath(file).name == "dataset.json"
+    }
+
+
+def touched_dataset_dirs(dataset_dirs: set[str], changed_files: list[str]) -> set[str]:
+    """The dataset folders that contain any of the changed files"""
+    touched = set()
+    for file in changed_files:
+        # Datasets can be nested, the file belongs to the innermost dataset
+        for parent in PurePosixPath(file).parents:
+            if str(parent) in dataset_dirs:
+                touched.add(str(parent))
+                break
+    return touched
+
+
+def changed_dataset_dirs(
+    repository: GitRepository, base_commit: str, update_commit: str
+) -> set[str]:
+    """
+    The dataset folders with changes between the commits, worked out from the tree diff.
+    Only the folders holding the changed files are looked up, not the whole catalogue.
+    Datasets that were added or removed are left out, there is nothing to diff.
+    """
+    changed_files = repository.changed_files(base_commit, update_commit, DATASETS_DIR)
+    if not changed_files:
+        return set()
+
+    candidates = sorted(
+        {
+            f"{parent}/dataset.json"
+            for file in changed_files
+            for parent in PurePosixPath(file).parents
+            if PurePosixPath(DATASETS_DIR) in parent.parents
+        }
+    )
+    base_dirs = find_dataset_dirs(repository.existing_files(base_commit, candidates))
+    update_dirs = find_dataset_dirs(repository.existing_files(update_commit, candidates))
+    return touched_dataset_dirs(base_dirs, changed_files) & touched_dataset_dirs(
+        update_dirs, changed_files
+    )
+
+
+class GitSchemaLoader(_FileBasedSchemaLoader):
+    """
+    Loads the datasets in the given dataset folders of a commit, reading the files
+    from the git repository. Only these datasets are known to the loader.
+    """
+
+    def __init__(self, repository: GitRepository, commit: str, dataset_dirs: set[str]):
+        super().__init__(f"{repository.path}@{commit}")
+        self.repository = repository
+        self.commit = commit
+        self.dataset_dirs = dataset_dirs
+
+    def _read_json(self, path: str):
+        contents = self.repository.read_file(self.commit, path)
+        if contents is None:
+            raise SchemaObjectNotFound(path)
+        try:
+            return json.loads(contents)
+        except json.JSONDecodeError as exc:
+            raise ValueError("Invalid JSON file") from exc
+
+    def _read_index(self) -> dict[str, str]:
+        id_to_path = {}
+        for dataset_dir in sorted(self.dataset_dirs):
+            file_json = self._read_json(f"{dataset_dir}/dataset.json")
+            if isinstance(file_json, dict) and file_json.get("type") == "dataset":
+                # Paths are relative to the datasets folder, like the other loaders
+                id_to_path[file_json["id"]] = str(
+                    PurePosixPath(dataset_dir).relative_to(DATASETS_DIR)
+                )
+        return id_to_path
+
+    def _read_dataset(self, dataset_id: str):
+        dataset_path = self.get_dataset_path(dataset_id)
+        return self._read_json(f"{DATASETS_DIR}/{dataset_path}/dataset.json")
+
+    def _read_table(self, dataset_id: str, table_ref: str):
+        dataset_path = self.get_dataset_path(dataset_id)
+        return self._read_json(f"{DATASETS_DIR}/{dataset_path}/{table_ref}.json")
+
+    def _read_view(self, dataset_id: str) -> str | None:
+        dataset_path = self.get_dataset_path(dataset_id)
+        contents = self.repository.read_file(
+            self.commit, f"{DATASETS_DIR}/{dataset_path}/dataset.sql"
+        )
+        return contents.decode() if contents is not None else None
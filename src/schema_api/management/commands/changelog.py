@@ -1,21 +1,26 @@
 from __future__ import annotations
 
-import os
-import shutil
 import subprocess
-import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 
+from django.conf import settings
 from django.core.management import BaseCommand
-from django.db.utils import IntegrityError
-from schematools.loaders import get_schema_loader
+from django.db import connections, transaction
 from schematools.types import DatasetSchema, SemVer
 
-from schema_api.models import ChangelogItem
+from schema_api.feed import get_broker
+from schema_api.git import (
+    DATASETS_DIR,
+    GitRepository,
+    GitSchemaLoader,
+    changed_dataset_dirs,
+    update_mirror,
+)
+from schema_api.models import ChangelogItem, ChangelogRun
+from schema_api.workers import setup_changelog_worker
 
-TMP_DIR = tempfile.TemporaryDirectory()
-TMP_NAME = TMP_DIR.name
-CHANGES_DIR = f"{TMP_NAME}/changes/"
 START_COMMIT = "c2e69fd322e3465b3c234949336288f8a0ee2ec7"
 
 
@@ -32,6 +37,12 @@ class Command(BaseCommand):
             default=["HEAD"],
             help="Last commit to generate updates from.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes that compare commits, the items are written in order.",
+        )
 
     def handle(self, *args, **options):
         try:
@@ -43,36 +54,47 @@ class Command(BaseCommand):
                 start_commit = _get_most_recent_commit()
 
             end_commit = options["end_commit"][0]
+            # Reprocessing a given range doesn't move the start of the next run
+            incremental = not options["start_commit"] and end_commit == "HEAD"
 
-            # Clone Amsterdam Schema repo and fetch all commits into master
-            subprocess.run(  # noqa: S603
-                [
-                    "bash",
-                    "schema_api/scripts/clone_ams_schema.sh",
-                    start_commit,
-                    end_commit,
-                    TMP_NAME,
-                ],
-                check=True,
-            )
+            # The mirror is kept between runs, only new commits are fetched
+            print("Updating the Amsterdam Schema mirror...")
+            repository_path = settings.CHANGELOG_REPOSITORY_DIR
+            update_mirror(settings.CHANGELOG_REPOSITORY_URL, repository_path)
 
             # Write updates to Changelog table
-            extend_changelog_table()
+            extend_changelog_table(
+                repository_path,
+                start_commit,
+                end_commit,
+                workers=options["workers"],
+                verbosity=options["verbosity"],
+                incremental=incremental,
+            )
         except subprocess.CalledProcessError as e:
-            print(e.with_traceback())
+            self.stderr.write(f"{e}\n{e.stderr}")
             self.stdout.write(
-                "Something went wrong in clone_ams_schema.sh or checkout_{base/update}_commit.sh, "
-                "tmp folder will be removed. Please run ./manage.py changelog again. "
+                "Something went wrong while updating the mirror or reading the commits. "
+                "Please run ./manage.py changelog again. "
             )
-            TMP_DIR.cleanup()
 
 
 def _get_most_recent_commit() -> str:
     """
-    Gets most recent commit from the db table as a starting point
-    to generate new updates from. Use the hard coded commit when
+    Gets the last commit that was fully processed by an incremental run as a starting
+    point to generate new updates from. Before the runs were recorded, this was
+    the most recent commit in the changelog table. Use the hard coded commit when
     running this command when changelog table is empty.
     """
+    run = (
+        ChangelogRun.objects.filter(incremental=True)
+        .exclude(last_commit="")
+        .order_by("-id")
+        .first()
+    )
+    if run is not None:
+        print("Using start commit from the last changelog run.")
+        return run.last_commit
     commits = ChangelogItem.objects.order_by("-committed_at")
     if commits:
         print("Using start commit from the db.")
@@ -82,13 +104,21 @@ def _get_most_recent_commit() -> str:
     return start_commit
 
 
-def extend_changelog_table():
+def extend_changelog_table(
+    repository_path,
+    start_commit: str,
+    end_commit: str,
+    workers: int = 1,
+    verbosity: int = 1,
+    incremental: bool = True,
+):
     """
     Main function: writes changelog updates for all commits into Amsterdam Schema
     """
 
-    # Load all commits and loop through them to extract info
-    commits = _load_changelog_commits()
+    # Load all commits from the start up to the end commit and loop through them to extract info
+    with GitRepository(repository_path) as repository:
+        commits = repository.commits_between(start_commit, end_commit)
 
     # We need a base commit and an update commit to compare against the base commit
     if len(commits) < 2:
@@ -97,106 +127,213 @@ def extend_changelog_table():
 
     print(f"Fetched {len(commits)} new commits.")
 
-    base_commit = ""
-    for update_commit in commits:
-        if base_commit:
-            print("****************************")
-            print(f"Base commit: {base_commit}")
-            print(f"Compare commit: {update_commit}")
-            print()
+    # Every update commit is compared against the commit before it
+    commit_pairs = list(zip(commits, commits[1:]))
+
+    # The items are written in commit order, also when they are collected by multiple workers
+    run = ChangelogRun.objects.create(incremental=incremental)
+    results = collect_changelog_items(repository_path, commit_pairs, workers)
+    for (base_commit, update_commit), items in zip(commit_pairs, results):
+        print("****************************")
+        print(f"Base commit: {base_commit}")
+        print(f"Compare commit: {update_commit}")
+        print()
+
+        # Saved together, so an interrupted run is continued after the last saved commit
+        with transaction.atomic():
+            inserted, skipped = write_commit_items(items, verbosity)
+            run.checkpoint(update_commit, inserted, skipped)
+
+    run.finish()
+    print(
+        f"Inserted {run.items_inserted} changelog item(s) in total, "
+        f"skipped {run.items_skipped} existing."
+    )
+
+
+def collect_changelog_items(
+    repository_path, commit_pairs: list[tuple[str, str]], workers: int = 1
+) -> Iterator[list[ChangelogItem] | None]:
+    """
+    Yields the changelog items of every (base, update) commit pair, in the order of the pairs.
+    With multiple workers the pairs are diffed in a pool of processes.
+    """
+    if workers <= 1:
+        # The schemas are read from the git objects, nothing is checked out
+        with GitRepository(repository_path) as repository:
+            carry = DatasetCarry()
+            for base_commit, update_commit in commit_pairs:
+                yield collect_commit_items(repository, base_commit, update_commit, carry)
+        return
+
+    # The workers set up Django themselves, they only read from git, not the database.
+    # Close the connections first, so a forked worker doesn't share their sockets.
+    connections.close_all()
 
-            # Extract changelog updates from update commit
-            process_commit(base_commit, update_commit)
+    # Each worker gets a run of consecutive pairs, so it can carry the datasets forward.
+    chunksize = max(1, len(commit_pairs) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=setup_changelog_worker,
+        initargs=(repository_path,),
+    ) as executor:
+        yield from executor.map(_collect_worker_commit_items, commit_pairs, chunksize=chunksize)
 
-            # Remove base commit dir (we'll keep the update dir for the next commit)
-            dir_path = os.path.join(os.getcwd(), CHANGES_DIR)
-            full_commit_dir = os.path.join(dir_path, base_commit)
-            shutil.rmtree(full_commit_dir)
 
-        # Update commit will be base for next commit
-        base_commit = update_commit
+_worker_repository: GitRepository | None = None
+_worker_carry: DatasetCarry | None = None
 
-    # Clean up tmp folder
-    TMP_DIR.cleanup()
 
+def _open_worker_repository(repository_path):
+    """Each worker process reads through its own git cat-file process"""
+    global _worker_repository, _worker_carry
+    _worker_repository = GitRepository(repository_path)
+    _worker_carry = DatasetCarry()
 
-def _load_changelog_commits():
-    """Load historical commits into master branch of Amsterdam Schema"""
 
-    with open(f"{TMP_NAME}/commits.txt") as f:
-        return [commit.strip("\n") for commit in f.readlines()]
+def _collect_worker_commit_items(commit_pair: tuple[str, str]) -> list[ChangelogItem] | None:
+    return collect_commit_items(_worker_repository, *commit_pair, _worker_carry)
 
 
-def process_commit(base_commit, update_commit):
+def process_commit(repository: GitRepository, base_commit, update_commit) -> tuple[int, int]:
     """
-    Check out 2 commits, extract the differences and write updates to Changelog table.
+    Extract the differences between 2 commits and write updates to Changelog table.
+    Returns the number of inserted and skipped (already existing) changelog items.
     """
+    return write_commit_items(collect_commit_items(repository, base_commit, update_commit))
 
-    # Only check out base commit if it doesn't exist
-    dir_path = os.path.join(os.getcwd(), CHANGES_DIR)
-    if base_commit not in os.listdir(dir_path):
-        args = [str(base_commit), TMP_NAME]
-        subprocess.run(  # noqa: S603
-            ["bash", "schema_api/scripts/checkout_commit.sh", *args], check=True
-        )
 
-    # Update commit will always be new
-    args = [str(update_commit), TMP_NAME]
-    output = subprocess.run(  # noqa: S603
-        ["bash", "schema_api/scripts/checkout_commit.sh", *args],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+def collect_commit_items(
+    repository: GitRepository, base_commit, update_commit, carry: DatasetCarry | None = None
+) -> list[ChangelogItem] | None:
+    """
+    Extract the changelog items of the update commit, without writing them.
+    Returns None when the commit is too old to compare.
+    """
 
     # Save the date
-    timestamp = output.stdout.strip()
-    date_time = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    date_time = repository.commit_time(update_commit)
     if date_time < datetime(2025, 12, 31, 0, 0, 0, tzinfo=timezone.utc):
-        print("Commit is too old, not compatible with meta-schema@v4")
-        return
+        return None
 
     # Extract differences between schemas
-    dataset_diffs = compare_schemas(base_commit, update_commit)
+    dataset_diffs = compare_schemas(repository, base_commit, update_commit, carry)
 
-    update_flag = False
-    for ds in dataset_diffs:
-        db_updates = dataset_diffs[ds]
-        if db_updates:
-            update_flag = True
+    # Collect the items of the commit, unique on their identity
+    items = {}
+    for db_updates in dataset_diffs.values():
+        for update in db_updates:
+            # Add commit hash and commit timestamp
+            item = ChangelogItem(**update, commit_hash=update_commit, committed_at=date_time)
+            item.set_computed_fields()
+            items[item.identity] = item
 
-            print(
-                f"Adding {len(db_updates)} changelog update(s) for dataset {ds.id} to database..."
-            )
-            for update in db_updates:
+    return list(items.values())
 
-                # Add commit hash and commit timestamp
-                update["commit_hash"] = update_commit
-                update["committed_at"] = date_time
 
-                # Create db instance of update (only allow unique entries)
-                try:
-                    item = ChangelogItem(**update)
-                    print(f"* {item}")
-                    item.save()
-                except IntegrityError:
-                    print(f"* {update} already exists in database.")
+def write_commit_items(
+    items: list[ChangelogItem] | None, verbosity: int = 1
+) -> tuple[int, int]:
+    """
+    Write the changelog items of a commit.
+    Returns the number of inserted and skipped (already existing) changelog items.
+    """
+    if items is None:
+        print("Commit is too old, not compatible with meta-schema@v4")
+        return 0, 0
 
     # Let user know if no changelog updates are found
-    if not update_flag:
+    if not items:
         print("No changelog updates extracted for this commit.\n")
+        return 0, 0
+
+    inserted = write_changelog_items(items, verbosity)
+    print(f"Inserted {inserted} changelog item(s), skipped {len(items) - inserted} existing.\n")
+    return inserted, len(items) - inserted
 
 
-def compare_schemas(base_commit: str, update_commit: str) -> dict[str:list]:
+def write_changelog_items(items: list[ChangelogItem], verbosity: int = 1) -> int:
     """
-    Extract DeepDiff differences between 2 commits for all dataset schemas.
+    Insert the changelog items that don't exist yet, in one transaction.
+    Returns the number of inserted items.
     """
+    with transaction.atomic():
+        stored = ChangelogItem.objects.filter(identity__in=[item.identity for item in items])
+        existing = set(stored.values_list("identity", flat=True))
+        new_items = [item for item in items if item.identity not in existing]
+
+        # Conflicts can still happen when the command runs twice at the same time,
+        # those rows are skipped by the database.
+        ChangelogItem.objects.bulk_create(new_items, batch_size=1000, ignore_conflicts=True)
+
+        # Count what is stored now, rather than trusting that every new item was inserted
+        inserted = stored.count() - len(existing)
+        if verbosity >= 2:
+            for item in new_items:
+                print(f"* {item}")
+
+        # bulk_create() doesn't send post_save, so wake up the changelog feeds here
+        if inserted:
+            get_broker().notify()
+
+    return inserted
+
+
+class DatasetCarry:
+    """
+    Keeps the parsed datasets of the last update commit, which is the base commit
+    of the next comparison. They are found by the git tree id of their folder,
+    so a dataset is only reused when none of its files changed.
+    """
+
+    def __init__(self):
+        self.datasets: dict[str, DatasetSchema] = {}
+
+    def load(
+        self, repository: GitRepository, commit: str, dataset_dirs: set[str]
+    ) -> dict[str, DatasetSchema]:
+        """The datasets in the folders of the commit, by tree id of the folder"""
+        dataset_dirs = sorted(dataset_dirs)
+        tree_ids = dict(zip(dataset_dirs, repository.tree_ids(commit, dataset_dirs)))
+        datasets = {
+            tree_id: self.datasets[tree_id]
+            for tree_id in tree_ids.values()
+            if tree_id in self.datasets
+        }
+
+        missing_dirs = {dir for dir, tree_id in tree_ids.items() if tree_id not in datasets}
+        if missing_dirs:
+            loader = GitSchemaLoader(repository, commit, missing_dirs)
+            for dataset in loader.get_all_datasets().values():
+                dataset_dir = f"{DATASETS_DIR}/{loader.get_dataset_path(dataset.id)}"
+                datasets[tree_ids[dataset_dir]] = dataset
+        return datasets
+
+
+def compare_schemas(
+    repository: GitRepository,
+    base_commit: str,
+    update_commit: str,
+    carry: DatasetCarry | None = None,
+) -> dict[str:list]:
+    """
+    Extract DeepDiff differences between 2 commits for the dataset schemas that changed.
+    Only the datasets touched by the commit are read and diffed. With a carry, the
+    datasets of the previous update commit are reused for the base commit.
+    """
+
+    dataset_dirs = changed_dataset_dirs(repository, base_commit, update_commit)
+    if not dataset_dirs:
+        return {}
 
-    base_path = CHANGES_DIR + base_commit + "/datasets"
-    update_path = CHANGES_DIR + update_commit + "/datasets"
+    if carry is None:
+        carry = DatasetCarry()
+    base_datasets = carry.load(repository, base_commit, dataset_dirs)
+    update_datasets = carry.load(repository, update_commit, dataset_dirs)
+    carry.datasets = update_datasets
 
-    base_schema = get_schema_loader(base_path).get_all_datasets()
-    update_schema = get_schema_loader(update_path).get_all_datasets()
+    base_schema = {dataset.id: dataset for dataset in base_datasets.values()}
+    update_schema = {dataset.id: dataset for dataset in update_datasets.values()}
 
     dataset_diffs = {}
 
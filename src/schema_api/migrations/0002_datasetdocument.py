@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:44
+
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+from schematools.naming import to_snake_case
+from schematools.types import DatasetSchema
+
+
+def simplify_json(schema: DatasetSchema):
+    """Frozen copy of schema_api.utils.simplify_json(), as the summary was at this point"""
+    schema_json = schema.json_data()
+
+    for vmajor, vdata in schema_json["versions"].items():
+        schema_json["versions"][vmajor]["tables"] = [
+            {"id": table["id"], "$ref": f"{to_snake_case(table['id'])}/{vmajor}"}
+            for table in vdata["tables"]
+        ]
+
+    return schema_json
+
+
+def create_dataset_documents(apps, schema_editor):
+    """Datasets that are not re-imported after deploying still need a document"""
+    Dataset = apps.get_model("datasets", "Dataset")
+    DatasetDocument = apps.get_model("schema_api", "DatasetDocument")
+
+    for dataset in Dataset.objects.exclude(schema_data="").iterator():
+        schema = DatasetSchema.from_dict(json.loads(dataset.schema_data))
+        DatasetDocument.objects.update_or_create(
+            dataset=dataset,
+            defaults={"summary_data": json.dumps(simplify_json(schema))},
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datasets", "0028_dataset_delete_date_datasettable_delete_date"),
+        ("schema_api", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DatasetDocument",
+            fields=[
+                (
+                    "dataset",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="document",
+                        serialize=False,
+                        to="datasets.dataset",
+                        to_field="name",
+                    ),
+                ),
+                ("summary_data", models.TextField()),
+            ],
+        ),
+        migrations.RunPython(create_dataset_documents, migrations.RunPython.noop),
+    ]
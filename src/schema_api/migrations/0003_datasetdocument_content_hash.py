@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:31
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def content_hash(schema_data: str) -> str:
+    """Frozen copy of schema_api.utils.content_hash()"""
+    return hashlib.sha256(schema_data.encode()).hexdigest()
+
+
+def set_content_hashes(apps, schema_editor):
+    DatasetDocument = apps.get_model("schema_api", "DatasetDocument")
+
+    for document in DatasetDocument.objects.select_related("dataset").iterator():
+        document.content_hash = content_hash(document.dataset.schema_data)
+        document.save(update_fields=["content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema_api", "0002_datasetdocument"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasetdocument",
+            name="content_hash",
+            field=models.CharField(default="", max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_content_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:49
+
+import hashlib
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def content_hash(schema_data: str) -> str:
+    """Frozen copy of schema_api.utils.content_hash()"""
+    return hashlib.sha256(schema_data.encode()).hexdigest()
+
+
+def create_schema_digests(apps, schema_editor):
+    """Scopes, publishers and profiles that are not re-imported still need a digest"""
+    SchemaDigest = apps.get_model("schema_api", "SchemaDigest")
+
+    for model_name in ("scope", "publisher", "profile"):
+        model = apps.get_model("datasets", model_name)
+        for instance in model.objects.iterator():
+            SchemaDigest.objects.update_or_create(
+                kind=model_name,
+                object_id=instance.pk,
+                defaults={"content_hash": content_hash(instance.schema_data)},
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datasets", "0028_dataset_delete_date_datasettable_delete_date"),
+        ("schema_api", "0003_datasetdocument_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasetdocument",
+            name="modified_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.CreateModel(
+            name="SchemaDigest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("kind", models.CharField(max_length=20)),
+                ("object_id", models.CharField(max_length=100)),
+                ("content_hash", models.CharField(max_length=64)),
+                ("modified_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "unique_together": {("kind", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_schema_digests, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:02
+
+import json
+
+import django.db.models.deletion
+import orjson
+from django.db import migrations, models
+from rest_framework.utils.encoders import JSONEncoder
+from schematools.naming import to_snake_case
+from schematools.types import DatasetSchema
+
+# Frozen copies of schema_api.utils.render_json() and render_dataset_documents(),
+# so later changes to those don't change what this migration writes.
+
+
+def render_json(data) -> str:
+    """JSON as the ORJSONRenderer rendered it at this point"""
+    ret = orjson.dumps(
+        data,
+        default=JSONEncoder().default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+    )
+    ret = ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+    return ret.decode()
+
+
+def render_dataset_documents(schema: DatasetSchema):
+    versions = {}
+    tables = {}
+    for vmajor, version in schema.versions.items():
+        versions[vmajor] = render_json(version.json_data())
+        for table in [*version.tables, *version.nested_tables]:
+            tables.setdefault((vmajor, to_snake_case(table.id)), render_json(table.json_data()))
+
+    return render_json(schema), versions, tables
+
+
+def create_schema_documents(apps, schema_editor):
+    """Datasets that are not re-imported after deploying still need their documents"""
+    DatasetDocument = apps.get_model("schema_api", "DatasetDocument")
+    DatasetVersionDocument = apps.get_model("schema_api", "DatasetVersionDocument")
+    DatasetTableDocument = apps.get_model("schema_api", "DatasetTableDocument")
+
+    for document in DatasetDocument.objects.select_related("dataset").iterator():
+        schema = DatasetSchema.from_dict(json.loads(document.dataset.schema_data))
+        schema_data, versions, tables = render_dataset_documents(schema)
+
+        document.schema_data = schema_data
+        document.save(update_fields=["schema_data"])
+        DatasetVersionDocument.objects.bulk_create(
+            DatasetVersionDocument(dataset_id=document.pk, vmajor=vmajor, schema_data=data)
+            for vmajor, data in versions.items()
+        )
+        DatasetTableDocument.objects.bulk_create(
+            DatasetTableDocument(
+                dataset_id=document.pk, vmajor=vmajor, table_id=table_id, schema_data=data
+            )
+            for (vmajor, table_id), data in tables.items()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datasets", "0028_dataset_delete_date_datasettable_delete_date"),
+        ("schema_api", "0004_datasetdocument_modified_at_schemadigest"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasetdocument",
+            name="schema_data",
+            field=models.TextField(default=""),
+            preserve_default=False,
+        ),
+        migrations.CreateModel(
+            name="DatasetVersionDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("vmajor", models.CharField(max_length=10)),
+                ("schema_data", models.TextField()),
+                (
+                    "dataset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="version_documents",
+                        to="datasets.dataset",
+                        to_field="name",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("dataset", "vmajor")},
+            },
+        ),
+        migrations.CreateModel(
+            name="DatasetTableDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("vmajor", models.CharField(max_length=10)),
+                ("table_id", models.CharField(max_length=100)),
+                ("schema_data", models.TextField()),
+                (
+                    "dataset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="table_documents",
+                        to="datasets.dataset",
+                        to_field="name",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("dataset", "vmajor", "table_id")},
+            },
+        ),
+        migrations.RunPython(create_schema_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:40
+
+import json
+
+from django.db import migrations, models
+from schematools.naming import to_snake_case
+from schematools.types import DatasetSchema
+
+# Frozen copies of schema_api.utils.render_table_auth_data() and the scope resolution
+# of schematools, so later changes to those don't change what this migration writes.
+
+
+def resolve_scope_ids(auth, scope_ids: dict[str, str]) -> list[str]:
+    """The ids of the scopes of an auth value, raises KeyError for an unknown scope"""
+    if auth is None:
+        auth = "OPENBAAR"
+
+    ids = []
+    for scope in auth if isinstance(auth, list) else [auth]:
+        if isinstance(scope, dict) and "$ref" not in scope:
+            ids.append(scope["id"])  # inlined scope
+            continue
+        if isinstance(scope, dict):
+            scope = scope["$ref"].removeprefix("scopes/")
+        ids.append(scope_ids[scope.replace("/", "_").lower()])
+    return sorted(ids)
+
+
+def render_table_auth_data(schema: DatasetSchema, scope_ids: dict[str, str]) -> dict:
+    dataset_auth = resolve_scope_ids(schema.get("auth"), scope_ids)
+    auth_data = {}
+    for vmajor, version in schema.versions.items():
+        for table in version.tables:
+            auth_data.setdefault(
+                (vmajor, to_snake_case(table.id)),
+                {
+                    "dataset": dataset_auth,
+                    "table": resolve_scope_ids(table.get("auth"), scope_ids),
+                    "fields": [
+                        [
+                            field.id,
+                            resolve_scope_ids(field.get("auth"), scope_ids),
+                            field.json_data(),
+                        ]
+                        for field in table.fields
+                    ],
+                },
+            )
+    return auth_data
+
+
+def set_table_auth_data(apps, schema_editor):
+    Dataset = apps.get_model("datasets", "Dataset")
+    Scope = apps.get_model("datasets", "Scope")
+    DatasetTableDocument = apps.get_model("schema_api", "DatasetTableDocument")
+
+    # Scopes are looked up by their url safe id, which is the primary key
+    scope_ids = {
+        scope.pk: json.loads(scope.schema_data)["id"] for scope in Scope.objects.iterator()
+    }
+
+    for dataset in Dataset.objects.filter(table_documents__isnull=False).distinct().iterator():
+        schema = DatasetSchema.from_dict(json.loads(dataset.schema_data))
+        try:
+            table_auth_data = render_table_auth_data(schema, scope_ids)
+        except KeyError:
+            # Unknown scope, the views filter the whole dataset for these tables
+            continue
+
+        for (vmajor, table_id), auth_data in table_auth_data.items():
+            DatasetTableDocument.objects.filter(
+                dataset_id=dataset.name, vmajor=vmajor, table_id=table_id
+            ).update(auth_data=auth_data)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datasets", "0028_dataset_delete_date_datasettable_delete_date"),
+        ("schema_api", "0005_dataset_version_and_table_documents"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasettabledocument",
+            name="auth_data",
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(set_table_auth_data, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:05
+
+import hashlib
+import json
+from datetime import UTC, datetime
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def changelog_identity(
+    dataset_id, status, object_id, operation, commit_hash, committed_at: datetime
+) -> str:
+    """
+    Frozen copy of schema_api.models.changelog_identity(), the backfilled
+    values have to match what the model computed when this migration was written.
+    """
+    if timezone.is_naive(committed_at):
+        committed_at = committed_at.replace(tzinfo=timezone.get_default_timezone())
+    values = [
+        dataset_id,
+        status,
+        object_id,
+        operation,
+        commit_hash,
+        committed_at.astimezone(UTC).isoformat(),
+    ]
+    return hashlib.sha256(json.dumps(values).encode()).hexdigest()
+
+
+def set_changelog_identity(apps, schema_editor):
+    ChangelogItem = apps.get_model("schema_api", "ChangelogItem")
+
+    items = []
+    for item in ChangelogItem.objects.iterator(chunk_size=1000):
+        item.identity = changelog_identity(
+            item.dataset_id,
+            item.status,
+            item.object_id,
+            item.operation,
+            item.commit_hash,
+            item.committed_at,
+        )
+        items.append(item)
+        if len(items) == 1000:
+            ChangelogItem.objects.bulk_update(items, ["identity"])
+            items = []
+
+    ChangelogItem.objects.bulk_update(items, ["identity"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema_api", "0006_datasettabledocument_auth_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="changelogitem",
+            name="identity",
+            field=models.CharField(max_length=64, null=True),
+        ),
+        migrations.RunPython(set_changelog_identity, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="changelogitem",
+            name="identity",
+            field=models.CharField(editable=False, max_length=64),
+        ),
+        migrations.AlterUniqueTogether(
+            name="changelogitem",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="changelogitem",
+            constraint=models.UniqueConstraint(
+                fields=("identity",), name="changelog_item_identity_unique"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="changelogitem",
+            index=models.Index(fields=["-committed_at"], name="changelog_committed_at_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="changelogitem",
+            index=models.Index(fields=["dataset_id", "-committed_at"], name="changelog_dataset_idx"),
+        ),
+    ]
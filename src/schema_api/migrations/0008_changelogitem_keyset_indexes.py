@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The indexes are replaced without locking the table for writes,
+    # the old ones are only dropped once the new ones can be used.
+    atomic = False
+
+    dependencies = [
+        ("schema_api", "0007_changelogitem_identity_and_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="changelogitem",
+            index=models.Index(fields=["-committed_at", "-id"], name="changelog_keyset_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="changelogitem",
+            index=models.Index(
+                fields=["dataset_id", "-committed_at", "-id"], name="changelog_dataset_keyset_idx"
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="changelogitem",
+            name="changelog_committed_at_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="changelogitem",
+            name="changelog_dataset_idx",
+        ),
+    ]
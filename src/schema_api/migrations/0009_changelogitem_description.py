@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+def changelog_description(object_id: str, operation: str, status: str) -> str:
+    """Frozen copy of schema_api.models.changelog_description()"""
+    # Table updates
+    if len(object_id.split("/")) == 3:
+        return f"{operation.capitalize()} table {object_id}."
+
+    # Dataset updates
+    else:
+        if operation == "status":
+            return f"Set status of dataset version {object_id} to {status}."
+        else:
+            return f"Create {status} dataset version {object_id}."
+
+
+def set_changelog_description(apps, schema_editor):
+    ChangelogItem = apps.get_model("schema_api", "ChangelogItem")
+
+    items = []
+    for item in ChangelogItem.objects.iterator(chunk_size=1000):
+        item.description = changelog_description(item.object_id, item.operation, item.status)
+        items.append(item)
+        if len(items) == 1000:
+            ChangelogItem.objects.bulk_update(items, ["description"])
+            items = []
+
+    ChangelogItem.objects.bulk_update(items, ["description"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema_api", "0008_changelogitem_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="changelogitem",
+            name="description",
+            field=models.CharField(default="", editable=False),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_changelog_description, migrations.RunPython.noop),
+    ]
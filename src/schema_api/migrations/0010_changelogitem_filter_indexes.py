@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema_api", "0009_changelogitem_description"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="changelogitem",
+            index=models.Index(
+                fields=["object_id"],
+                name="changelog_object_id_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="changelogitem",
+            index=models.Index(fields=["commit_hash"], name="changelog_commit_hash_idx"),
+        ),
+    ]
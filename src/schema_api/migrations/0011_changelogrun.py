@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema_api", "0010_changelogitem_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangelogRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("started_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("finished_at", models.DateTimeField(null=True)),
+                ("last_commit", models.CharField(blank=True, max_length=40)),
+                ("commits_processed", models.PositiveIntegerField(default=0)),
+                ("items_inserted", models.PositiveIntegerField(default=0)),
+                ("items_skipped", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schema_api", "0011_changelogrun"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="changelogrun",
+            name="incremental",
+            field=models.BooleanField(default=True),
+        ),
+    ]
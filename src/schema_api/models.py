@@ -1,4 +1,40 @@
+import hashlib
+import json
+from datetime import UTC, datetime
+
 from django.db import models
+from django.utils import timezone
+from schematools.contrib.django.models import Dataset
+
+
+def changelog_identity(
+    dataset_id, status, object_id, operation, commit_hash, committed_at: datetime
+) -> str:
+    """Hash of the values that make a changelog item unique"""
+    if timezone.is_naive(committed_at):
+        committed_at = committed_at.replace(tzinfo=timezone.get_default_timezone())
+    values = [
+        dataset_id,
+        status,
+        object_id,
+        operation,
+        commit_hash,
+        committed_at.astimezone(UTC).isoformat(),
+    ]
+    return hashlib.sha256(json.dumps(values).encode()).hexdigest()
+
+
+def changelog_description(object_id: str, operation: str, status: str) -> str:
+    # Table updates
+    if len(object_id.split("/")) == 3:
+        return f"{operation.capitalize()} table {object_id}."
+
+    # Dataset updates
+    else:
+        if operation == "status":
+            return f"Set status of dataset version {object_id} to {status}."
+        else:
+            return f"Create {status} dataset version {object_id}."
 
 
 class ChangelogItem(models.Model):
@@ -10,27 +46,175 @@ class ChangelogItem(models.Model):
     committed_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Replaces a unique constraint on all the fields above, see compute_identity()
+    identity = models.CharField(max_length=64, editable=False)
+    # Stored, so the list views can serve it straight from the query
+    description = models.CharField(editable=False)
+
     class Meta:
-        unique_together = [
-            "dataset_id",
-            "status",
-            "object_id",
-            "operation",
-            "commit_hash",
-            "committed_at",
+        constraints = [
+            models.UniqueConstraint(fields=["identity"], name="changelog_item_identity_unique"),
+        ]
+        indexes = [
+            # Match the (committed_at, id) ordering of the keyset pagination
+            models.Index(fields=["-committed_at", "-id"], name="changelog_keyset_idx"),
+            models.Index(
+                fields=["dataset_id", "-committed_at", "-id"], name="changelog_dataset_keyset_idx"
+            ),
+            # For the filters of the changelog lists, and object_id prefix matching
+            models.Index(
+                fields=["object_id"],
+                opclasses=["varchar_pattern_ops"],
+                name="changelog_object_id_idx",
+            ),
+            models.Index(fields=["commit_hash"], name="changelog_commit_hash_idx"),
         ]
 
     def __str__(self):
-        return f"{self.description()} ({self.committed_at})"
+        return f"{self.compute_description()} ({self.committed_at})"
 
-    def description(self):
-        # Table updates
-        if len(self.object_id.split("/")) == 3:
-            return f"{self.operation.capitalize()} table {self.object_id}."
+    def save(self, *args, **kwargs):
+        self.set_computed_fields()
+        super().save(*args, **kwargs)
 
-        # Dataset updates
-        else:
-            if self.operation == "status":
-                return f"Set status of dataset version {self.object_id} to {self.status}."
-            else:
-                return f"Create {self.status} dataset version {self.object_id}."
+    def set_computed_fields(self):
+        """Fill in the stored identity and description, bulk_create() doesn't call save()"""
+        self.identity = self.compute_identity()
+        self.description = self.compute_description()
+
+    def compute_description(self) -> str:
+        return changelog_description(self.object_id, self.operation, self.status)
+
+    def compute_identity(self) -> str:
+        committed_at = self._meta.get_field("committed_at").to_python(self.committed_at)
+        return changelog_identity(
+            self.dataset_id,
+            self.status,
+            self.object_id,
+            self.operation,
+            self.commit_hash,
+            committed_at,
+        )
+
+
+class ChangelogRun(models.Model):
+    """
+    A run of the changelog command. The last fully processed commit is saved
+    together with its changelog items, so the next run starts after it.
+    """
+
+    started_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(null=True)
+    last_commit = models.CharField(max_length=40, blank=True)
+    commits_processed = models.PositiveIntegerField(default=0)
+    items_inserted = models.PositiveIntegerField(default=0)
+    items_skipped = models.PositiveIntegerField(default=0)
+    # False for a run over a given range of commits, which can be older than what was
+    # processed already. Only incremental runs decide where the next run starts.
+    incremental = models.BooleanField(default=True)
+
+    def __str__(self):
+        return f"Changelog run {self.started_at} ({self.last_commit or 'no commits'})"
+
+    def checkpoint(self, commit: str, inserted: int, skipped: int):
+        """Record a processed commit, call in the transaction that writes its items"""
+        self.last_commit = commit
+        self.commits_processed += 1
+        self.items_inserted += inserted
+        self.items_skipped += skipped
+        self.save(
+            update_fields=["last_commit", "commits_processed", "items_inserted", "items_skipped"]
+        )
+
+    def finish(self):
+        self.finished_at = timezone.now()
+        self.save(update_fields=["finished_at"])
+
+
+class DatasetDocument(models.Model):
+    """
+    Pre-rendered representations of a Dataset, written on every import_schemas
+    so the API can serve them without parsing the schema again.
+    """
+
+    dataset = models.OneToOneField(
+        Dataset,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        to_field="name",
+        related_name="document",
+    )
+
+    # Hash of Dataset.schema_data, changes whenever the dataset is updated
+    content_hash = models.CharField(max_length=64)
+    modified_at = models.DateTimeField(default=timezone.now)
+
+    # Dataset as listed in /datasets, with the inlined tables replaced by a reference
+    summary_data = models.TextField()
+
+    # Dataset as served by /datasets/<name> without filters
+    schema_data = models.TextField()
+
+    def __str__(self):
+        return self.dataset_id
+
+
+class DatasetVersionDocument(models.Model):
+    """Version of a Dataset as served by /datasets/<name>/<vmajor> without filters"""
+
+    dataset = models.ForeignKey(
+        Dataset,
+        on_delete=models.CASCADE,
+        to_field="name",
+        related_name="version_documents",
+    )
+    vmajor = models.CharField(max_length=10)
+    schema_data = models.TextField()
+
+    class Meta:
+        unique_together = ["dataset", "vmajor"]
+
+    def __str__(self):
+        return f"{self.dataset_id}/{self.vmajor}"
+
+
+class DatasetTableDocument(models.Model):
+    """Table of a Dataset as served by /datasets/<name>/<vmajor>/<table_id> without filters"""
+
+    dataset = models.ForeignKey(
+        Dataset,
+        on_delete=models.CASCADE,
+        to_field="name",
+        related_name="table_documents",
+    )
+    vmajor = models.CharField(max_length=10)
+    table_id = models.CharField(max_length=100)  # snake_case, as matched by get_table_by_id()
+    schema_data = models.TextField()
+
+    # Scopes of the dataset, table and fields for scope filtering, see filter_table_document().
+    # Refreshed when a scope changes, null while a scope is missing.
+    auth_data = models.JSONField(null=True)
+
+    class Meta:
+        unique_together = ["dataset", "vmajor", "table_id"]
+
+    def __str__(self):
+        return f"{self.dataset_id}/{self.vmajor}/{self.table_id}"
+
+
+class SchemaDigest(models.Model):
+    """
+    Content hash of a Scope, Publisher or Profile, written on every import
+    so the API can answer conditional requests without loading the schema.
+    """
+
+    kind = models.CharField(max_length=20)  # model_name of the schematools model
+    object_id = models.CharField(max_length=100)
+    content_hash = models.CharField(max_length=64)
+    modified_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ["kind", "object_id"]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}"
@@ -44,9 +44,22 @@ with open(EXAMPLE_RESPONSES_DIR / "dataset_example.json", encoding="utf-8") as f
     DATASET_EXAMPLE_SCHEMA = DatasetSchema.from_dict(dataset_example)
 
 
+CURSOR_PARAM = OpenApiParameter(
+    name="cursor",
+    description="Pagineren met een cursor in plaats van paginanummers, gesorteerd op naam. "
+    "Geef een lege waarde mee voor de eerste pagina, en volg daarna de 'next' link.",
+)
+
+PAGE_SIZE_PARAM = OpenApiParameter(
+    name="page_size",
+    type=int,
+    description="Aantal resultaten per pagina bij paginering met een cursor (maximaal 100).",
+)
+
 list_datasets_schema = extend_schema(
     description="Vraag alle datasets op",
     summary="Alle datasets",
+    parameters=[CURSOR_PARAM, PAGE_SIZE_PARAM],
     responses={
         200: OpenApiResponse(
             response={"type": "array", "properties": {}},
@@ -130,6 +143,35 @@ retrieve_datasets_schema_v_t = extend_schema(
     tags=["Dataset"],
 )
 
+NAMES_PARAM = OpenApiParameter(
+    name="names",
+    description="Komma-gescheiden lijst van datasets die worden opgevraagd. Als een dataset niet "
+    "bestaat, geeft het endpoint een 404 met de ontbrekende datasets.",
+    required=True,
+)
+
+retrieve_datasets_bulk_schema = extend_schema(
+    description="Vraag meerdere datasets in een keer op, met dezelfde filtering op scopes en "
+    "tabellen als bij een enkele dataset. Dit endpoint geeft alleen JSON terug, andere formaten "
+    "geven een 406. Een dataset met de naam 'bulk' is niet via /datasets/bulk op te vragen.",
+    summary="Opgevraagde datasets",
+    parameters=[NAMES_PARAM, SCOPES_PARAM, TABLES_PARAM],
+    responses={
+        200: OpenApiResponse(
+            response={"type": "array", "items": {"type": "object"}},
+            examples=[
+                OpenApiExample(
+                    DATASET_EXAMPLE_SCHEMA.title,
+                    value=[DATASET_EXAMPLE_SCHEMA.json_data()],
+                )
+            ],
+        ),
+        404: OpenApiResponse(description="Een of meer datasets bestaan niet"),
+        406: OpenApiResponse(description="Alleen JSON wordt ondersteund"),
+    },
+    tags=["Dataset"],
+)
+
 # Load example Scope json response
 with open(EXAMPLE_RESPONSES_DIR / "scope_example.json", encoding="utf-8") as file:
     scope_example = json.load(file)
@@ -235,10 +277,56 @@ FROM_DATE_PARAM = OpenApiParameter(
     "from_date ligt worden getoond.",
 )
 
+TO_DATE_PARAM = OpenApiParameter(
+    name="to_date",
+    description="Datum (YYYY-MM-DD) als string om changelog items te filteren op "
+    "de datum van de commit. Alleen changelog items waarvan de commit datum op of voor de "
+    "to_date ligt worden getoond.",
+)
+
+CHANGELOG_FILTER_PARAMS = [
+    FROM_DATE_PARAM,
+    TO_DATE_PARAM,
+    OpenApiParameter(
+        name="operation",
+        description="Komma-gescheiden lijst van operaties, bijvoorbeeld 'create,update'.",
+    ),
+    OpenApiParameter(
+        name="status",
+        description="Komma-gescheiden lijst van statussen, bijvoorbeeld 'stable'.",
+    ),
+    OpenApiParameter(
+        name="object_id",
+        description="Begin van het id van het object, bijvoorbeeld 'gebieden/v1' voor alle "
+        "wijzigingen in die versie van de dataset.",
+    ),
+    OpenApiParameter(
+        name="commit_hash",
+        description="Alleen de changelog items van deze commit.",
+    ),
+]
+
+DATASET_ID_PARAM = OpenApiParameter(
+    name="dataset_id",
+    description="Komma-gescheiden lijst van datasets.",
+)
+
+CHANGELOG_CURSOR_PARAM = OpenApiParameter(
+    name="cursor",
+    description="Pagineren met een cursor in plaats van paginanummers, van nieuw naar oud. "
+    "Geef een lege waarde mee voor de eerste pagina, en volg daarna de 'next' link. "
+    "Items die tussendoor worden toegevoegd verschuiven de volgende pagina's niet.",
+)
+
 list_changelog_schema = extend_schema(
     description="Vraag alle changelog items op, gesorteerd van nieuwste naar oudste",
     summary="Alle changelog items",
-    parameters=[FROM_DATE_PARAM],
+    parameters=[
+        *CHANGELOG_FILTER_PARAMS,
+        DATASET_ID_PARAM,
+        CHANGELOG_CURSOR_PARAM,
+        PAGE_SIZE_PARAM,
+    ],
     responses={
         200: OpenApiResponse(
             response=ChangelogItemSerializer,
@@ -250,7 +338,7 @@ list_changelog_schema = extend_schema(
 list_changelog_schema_dataset = extend_schema(
     description="Vraag alle changelog items op van een bepaalde dataset",
     summary="Alle changelog items van dataset",
-    parameters=[FROM_DATE_PARAM],
+    parameters=[*CHANGELOG_FILTER_PARAMS, CHANGELOG_CURSOR_PARAM, PAGE_SIZE_PARAM],
     responses={
         200: OpenApiResponse(
             response=ChangelogItemSerializer,
@@ -259,6 +347,116 @@ list_changelog_schema_dataset = extend_schema(
     tags=["Changelog"],
 )
 
+list_changelog_commits_schema = extend_schema(
+    description="Vraag de commits op met de changelog items van iedere commit, gesorteerd van "
+    "nieuwste naar oudste. Er wordt gepagineerd met een cursor, volg daarvoor de 'next' link. "
+    "Accepteert dezelfde filters als de lijst van changelog items.",
+    summary="Changelog items per commit",
+    parameters=[*CHANGELOG_FILTER_PARAMS, DATASET_ID_PARAM, PAGE_SIZE_PARAM],
+    responses={
+        200: OpenApiResponse(
+            response={
+                "type": "object",
+                "properties": {
+                    "next": {"type": "string", "nullable": True},
+                    "previous": {"type": "string", "nullable": True},
+                    "results": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "commit_hash": {"type": "string"},
+                                "committed_at": {"type": "string", "format": "date-time"},
+                                "items": {"type": "array", "items": {"type": "object"}},
+                            },
+                        },
+                    },
+                },
+            },
+        )
+    },
+    tags=["Changelog"],
+)
+
+changelog_aggregates_schema = extend_schema(
+    description="Vraag het aantal changelog items op per periode, gegroepeerd op dataset, "
+    "operatie en status. Accepteert dezelfde filters als de lijst van changelog items.",
+    summary="Aantallen changelog items",
+    parameters=[
+        OpenApiParameter(
+            name="group_by",
+            description="Komma-gescheiden lijst van velden om op te groeperen: dataset_id, "
+            "operation en/of status. Standaard wordt op alle drie gegroepeerd.",
+        ),
+        OpenApiParameter(
+            name="period",
+            enum=["day", "week", "month"],
+            description="Lengte van de periodes, standaard 'day'. De periode wordt aangeduid "
+            "met de eerste dag ervan.",
+        ),
+        *CHANGELOG_FILTER_PARAMS,
+        DATASET_ID_PARAM,
+    ],
+    responses={
+        200: OpenApiResponse(
+            response={
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "period": {"type": "string", "format": "date"},
+                        "dataset_id": {"type": "string"},
+                        "operation": {"type": "string"},
+                        "status": {"type": "string"},
+                        "count": {"type": "integer"},
+                    },
+                },
+            },
+            examples=[
+                OpenApiExample(
+                    "Per dag",
+                    value=[
+                        {
+                            "period": "2026-01-02",
+                            "dataset_id": "gebieden",
+                            "operation": "update",
+                            "status": "stable",
+                            "count": 2,
+                        }
+                    ],
+                )
+            ],
+        )
+    },
+    tags=["Changelog"],
+)
+
+LAST_ID_PARAM = OpenApiParameter(
+    name="last_id",
+    type=int,
+    description="Id van het laatst ontvangen changelog item, de feed gaat verder met de items "
+    "daarna. In plaats hiervan kan ook de Last-Event-ID header worden meegegeven. "
+    "Zonder deze parameter worden alleen nieuwe items gestuurd.",
+)
+
+changelog_feed_schema = extend_schema(
+    description="Ontvang nieuwe changelog items zodra ze zijn toegevoegd, als Server-Sent "
+    "Events. Ieder event bevat een changelog item, met het id van het item als event id. "
+    "De verbinding wordt na enkele minuten gesloten, waarna de client opnieuw verbindt.",
+    summary="Feed van nieuwe changelog items",
+    parameters=[LAST_ID_PARAM],
+    responses={
+        (200, "text/event-stream"): OpenApiResponse(
+            response={"type": "string"},
+            description="Events met het type 'changelog', en als data een changelog item",
+        ),
+        503: OpenApiResponse(
+            description="Te veel open feeds, opnieuw verbinden na de seconden in Retry-After"
+        ),
+    },
+    tags=["Changelog"],
+)
+
 retrieve_changelog_schema = extend_schema(
     description="Vraag een changelog item op",
     summary="Opgevraagd changelog item",
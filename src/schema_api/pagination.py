@@ -0,0 +1,116 @@
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+class DatasetCursorPagination(CursorPagination):
+    """
+    Keyset pagination of the dataset list, ordered on the dataset name.
+
+    This avoids the COUNT and OFFSET queries of the default pagination,
+    so crawling the whole list stays cheap. It's enabled by passing the
+    (empty for the first page) ``cursor`` parameter.
+    """
+
+    ordering = "dataset_id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset pagination on a datetime field plus a unique tiebreaker, newest first.
+
+    The datetime is not unique, so the cursor holds the position of the last item
+    as (datetime, tiebreaker) instead of the datetime and an offset. Following a cursor
+    continues right after that item, also when items were inserted in the meantime.
+    """
+
+    ordering = ("-committed_at", "-id")
+    tiebreaker_type = int
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self.cursor.position if self.cursor else None
+
+        field, tiebreaker = (order.lstrip("-") for order in self.ordering)
+        if reverse:
+            queryset = queryset.order_by(field, tiebreaker)
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            value, tiebreaker_value = self.parse_position(position)
+            lookup = "gt" if reverse else "lt"
+            queryset = queryset.filter(
+                Q(**{f"{field}__{lookup}": value})
+                | Q(**{field: value, f"{tiebreaker}__{lookup}": tiebreaker_value})
+            )
+
+        # One extra item tells whether there is a following page
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following_position = len(results) > self.page_size
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering)
+            if has_following_position
+            else None
+        )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following_position
+            self.next_position = position
+            self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = position is not None
+            self.next_position = following_position
+            self.previous_position = position
+
+        if self.has_previous or self.has_next:
+            self.display_page_controls = True
+
+        return self.page
+
+    def parse_position(self, position: str) -> tuple:
+        value, _, tiebreaker_value = position.rpartition("|")
+        try:
+            return datetime.fromisoformat(value), self.tiebreaker_type(tiebreaker_value)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message) from None
+
+    def _get_position_from_instance(self, instance, ordering):
+        field, tiebreaker = (order.lstrip("-") for order in ordering)
+        if isinstance(instance, dict):
+            value, tiebreaker_value = instance[field], instance[tiebreaker]
+        else:
+            value, tiebreaker_value = getattr(instance, field), getattr(instance, tiebreaker)
+        return f"{value.isoformat()}|{tiebreaker_value}"
+
+
+class ChangelogCursorPagination(KeysetCursorPagination):
+    """Pagination of the changelog items, continues after the last (committed_at, id)"""
+
+    ordering = ("-committed_at", "-id")
+
+
+class ChangelogCommitCursorPagination(KeysetCursorPagination):
+    """Pagination of the changelog grouped by commit, a commit has a single committed_at"""
+
+    ordering = ("-committed_at", "-commit_hash")
+    tiebreaker_type = str
+
+
+def is_cursor_request(request) -> bool:
+    return CursorPagination.cursor_query_param in request.query_params
@@ -0,0 +1,88 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes with orjson, producing the same output as the
+    regular JSONRenderer apart from whitespace.
+
+    Views can skip encoding for data that is already stored as JSON:
+    a ``bytes`` response is sent as-is, and ``orjson.Fragment`` objects
+    can be embedded anywhere in the data (e.g. in a paginated result).
+    """
+
+    # Datetimes are passed to the DRF encoder, so they are formatted the same way
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if isinstance(data, bytes):
+            return data
+
+        renderer_context = renderer_context or {}
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context):
+            # orjson only knows about 2 spaces
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=options)
+
+        # Same escaping of \u2028 and \u2029 as JSONRenderer,
+        # to output JSON that is a strict javascript subset.
+        return ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class NDJSONRenderer(ORJSONRenderer):
+    """
+    Newline delimited JSON, used to export complete lists.
+
+    The list views stream their exports with ``render_line()``.
+    Other responses (e.g. errors) are rendered here, a list as one line per item.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        # Each item must stay on a single line
+        return None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        items = data if isinstance(data, list) else [data]
+        return b"".join(self.render_line(item) for item in items)
+
+    def render_line(self, item) -> bytes:
+        return super().render(item) + b"\n"
+
+
+class EventStreamRenderer(ORJSONRenderer):
+    """
+    Server-Sent Events, used by the changelog feed.
+
+    The feed streams its events with ``render_event()``, other responses
+    (e.g. errors) are rendered as a single "error" event.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        # The data of an event must stay on a single line
+        return None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return self.render_event(data, event="error")
+
+    def render_event(self, data, event: str, event_id=None) -> bytes:
+        lines = [f"event: {event}".encode()]
+        if event_id is not None:
+            lines.append(f"id: {event_id}".encode())
+        lines.append(b"data: " + super().render(data))
+        return b"\n".join(lines) + b"\n\n"
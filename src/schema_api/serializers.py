@@ -1,14 +1,70 @@
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.db.models.functions import JSONObject
 from rest_framework import serializers
 
 from .models import ChangelogItem
 
 
 class ChangelogItemSerializer(serializers.ModelSerializer):
-    description = serializers.SerializerMethodField()
-
     class Meta:
         model = ChangelogItem
-        fields = "__all__"
+        fields = [
+            "id",
+            "dataset_id",
+            "status",
+            "object_id",
+            "operation",
+            "commit_hash",
+            "committed_at",
+            "created_at",
+            "description",
+        ]
+
+
+class ChangelogItemValuesSerializer:
+    """
+    Gives the same output as ChangelogItemSerializer for ``.values()`` rows,
+    so lists don't need model instances and the per-field serializer overhead.
+    Only the datetimes have to be converted.
+    """
+
+    fields = ChangelogItemSerializer.Meta.fields
+    datetime_fields = ["committed_at", "created_at"]
+
+    def __init__(self):
+        self.datetime_field = serializers.DateTimeField()
+
+    def values(self, queryset):
+        return queryset.values(*self.fields)
+
+    def to_representation(self, row: dict) -> dict:
+        return {
+            **row,
+            **{
+                field_name: self.datetime_field.to_representation(row[field_name])
+                for field_name in self.datetime_fields
+            },
+        }
+
+
+class ChangelogCommitValuesSerializer(ChangelogItemValuesSerializer):
+    """
+    One entry per commit with its items nested. The items are collected by the
+    database, in the same grouped query as the commits.
+    """
+
+    fields = ["commit_hash", "committed_at"]
+    item_fields = ["id", "dataset_id", "status", "object_id", "operation", "description"]
+    datetime_fields = ["committed_at"]
+
+    def values(self, queryset):
+        return queryset.values(*self.fields).annotate(
+            items=JSONBAgg(
+                JSONObject(**{field: field for field in self.item_fields}), order_by="id"
+            )
+        )
 
-    def get_description(self, obj):
-        return obj.description()
+    def to_representation(self, row: dict) -> dict:
+        # jsonb doesn't keep the order of the keys
+        items = [{field: item[field] for field in self.item_fields} for item in row["items"]]
+        return {**super().to_representation(row), "items": items}
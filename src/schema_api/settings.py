@@ -1,3 +1,4 @@
+import tempfile
 from pathlib import Path
 
 import environ
@@ -328,7 +329,8 @@ REST_FRAMEWORK = dict(
     DEFAULT_RENDERER_CLASSES=[
         # Removed HTML rendering, Give pure application/problem+json responses instead.
         # The HTML rendering is not needed and conflicts with the exception_handler code.
-        "rest_framework.renderers.JSONRenderer",
+        "schema_api.renderers.ORJSONRenderer",
+        "schema_api.renderers.NDJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     DEFAULT_SCHEMA_CLASS="drf_spectacular.openapi.AutoSchema",
@@ -379,3 +381,30 @@ SCHEMA_URL = env.str("SCHEMA_URL", "https://schemas.data.amsterdam.nl/datasets/"
 SCHEMA_DEFS_URL = env.str("SCHEMA_DEFS_URL", "https://schemas.data.amsterdam.nl/schema")
 PROFILES_URL = env.str("PROFILES_URL", "https://schemas.data.amsterdam.nl/profiles/")
 APPEND_SLASH = False
+
+# Parsed dataset schemas kept in memory per worker, the size is in bytes of schema JSON
+DATASET_SCHEMA_CACHE_MAX_ENTRIES = env.int("DATASET_SCHEMA_CACHE_MAX_ENTRIES", 100)
+DATASET_SCHEMA_CACHE_MAX_SIZE = env.int("DATASET_SCHEMA_CACHE_MAX_SIZE", 64 * 1024 * 1024)
+# Seconds that scope/table filtered schemas are kept in CACHES, the key changes on updates
+FILTERED_SCHEMA_CACHE_TIMEOUT = env.int("FILTERED_SCHEMA_CACHE_TIMEOUT", 60 * 60)
+# Same for the changelog aggregates, their key changes when new items are stored
+CHANGELOG_AGGREGATES_CACHE_TIMEOUT = env.int("CHANGELOG_AGGREGATES_CACHE_TIMEOUT", 60 * 60)
+
+# The changelog command reads Amsterdam Schema from a bare mirror, kept between runs
+CHANGELOG_REPOSITORY_URL = env.str(
+    "CHANGELOG_REPOSITORY_URL", "https://github.com/Amsterdam/amsterdam-schema.git"
+)
+CHANGELOG_REPOSITORY_DIR = env.str(
+    "CHANGELOG_REPOSITORY_DIR", str(Path(tempfile.gettempdir()) / "amsterdam-schema.git")
+)
+
+# The changelog feed is woken up by the changelog command through this broker
+CHANGELOG_FEED_BROKER = env.str("CHANGELOG_FEED_BROKER", "schema_api.feed.PostgresBroker")
+# Seconds between keep-alive comments of the feed, and until the feed is closed.
+# Each open feed occupies a worker, so the client has to reconnect now and then.
+CHANGELOG_FEED_HEARTBEAT = env.int("CHANGELOG_FEED_HEARTBEAT", 15)
+CHANGELOG_FEED_MAX_DURATION = env.int("CHANGELOG_FEED_MAX_DURATION", 5 * 60)
+# Open feeds per process, keep this below the number of uwsgi threads so other requests
+# are still served. Above it, clients get a 503 and retry after the given seconds.
+CHANGELOG_FEED_MAX_CONNECTIONS = env.int("CHANGELOG_FEED_MAX_CONNECTIONS", 8)
+CHANGELOG_FEED_RETRY_AFTER = env.int("CHANGELOG_FEED_RETRY_AFTER", 30)
@@ -0,0 +1,131 @@
+import json
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from schematools.contrib.django.models import Dataset, Profile, Publisher, Scope
+
+from .feed import get_broker
+from .models import (
+    ChangelogItem,
+    DatasetDocument,
+    DatasetTableDocument,
+    DatasetVersionDocument,
+    SchemaDigest,
+)
+from .utils import (
+    content_hash,
+    render_dataset_documents,
+    render_table_auth_data,
+    simplify_json,
+)
+
+
+@receiver(post_save, sender=Dataset)
+def update_dataset_document(sender, instance: Dataset, update_fields=None, **kwargs):
+    """
+    Write the stored representations of a dataset whenever import_schemas saves it
+    """
+    if update_fields is not None and "schema_data" not in update_fields:
+        return
+
+    if not instance.schema_data:
+        DatasetDocument.objects.filter(dataset=instance).delete()
+        return
+
+    # import_schemas saves every dataset, only a changed schema is a modification
+    schema_hash = content_hash(instance.schema_data)
+    if DatasetDocument.objects.filter(dataset=instance, content_hash=schema_hash).exists():
+        return
+
+    schema_data, versions, tables = render_dataset_documents(instance.schema)
+    table_auth_data = render_table_auth_data(instance.schema)
+    with transaction.atomic():
+        DatasetDocument.objects.update_or_create(
+            dataset=instance,
+            defaults={
+                "content_hash": schema_hash,
+                "modified_at": timezone.now(),
+                "summary_data": json.dumps(simplify_json(instance.schema)),
+                "schema_data": schema_data,
+            },
+        )
+
+        DatasetVersionDocument.objects.filter(dataset=instance).delete()
+        DatasetVersionDocument.objects.bulk_create(
+            DatasetVersionDocument(dataset=instance, vmajor=vmajor, schema_data=data)
+            for vmajor, data in versions.items()
+        )
+        DatasetTableDocument.objects.filter(dataset=instance).delete()
+        DatasetTableDocument.objects.bulk_create(
+            DatasetTableDocument(
+                dataset=instance,
+                vmajor=vmajor,
+                table_id=table_id,
+                schema_data=data,
+                auth_data=table_auth_data.get((vmajor, table_id)),
+            )
+            for (vmajor, table_id), data in tables.items()
+        )
+
+
+def update_table_auth_data(scope: Scope):
+    """
+    Refresh the auth data of the stored tables that refer to the scope. It's resolved
+    against the Scope table, so a dataset imported before its scopes gets it here,
+    and a changed or removed scope doesn't leave outdated auth data behind.
+    """
+    # Scopes are referred to by their id, or inlined with it. The lookup by id
+    # is case insensitive and accepts the url safe form, like the primary key.
+    scope_id = json.loads(scope.schema_data)["id"]
+    datasets = Dataset.objects.filter(
+        Q(schema_data__icontains=scope_id) | Q(schema_data__icontains=scope.pk),
+        document__isnull=False,
+    )
+    for dataset in datasets:
+        table_auth_data = render_table_auth_data(dataset.schema)
+        table_documents = list(DatasetTableDocument.objects.filter(dataset=dataset))
+        for table_document in table_documents:
+            table_document.auth_data = table_auth_data.get(
+                (table_document.vmajor, table_document.table_id)
+            )
+        DatasetTableDocument.objects.bulk_update(table_documents, ["auth_data"])
+
+
+@receiver(post_save, sender=Scope)
+@receiver(post_save, sender=Publisher)
+@receiver(post_save, sender=Profile)
+def update_schema_digest(sender, instance, **kwargs):
+    """Keep the content hash of scopes, publishers and profiles up to date"""
+    kind = sender._meta.model_name
+    schema_hash = content_hash(instance.schema_data)
+    if SchemaDigest.objects.filter(
+        kind=kind, object_id=instance.pk, content_hash=schema_hash
+    ).exists():
+        return
+
+    SchemaDigest.objects.update_or_create(
+        kind=kind,
+        object_id=instance.pk,
+        defaults={"content_hash": schema_hash, "modified_at": timezone.now()},
+    )
+    if sender is Scope:
+        update_table_auth_data(instance)
+
+
+@receiver(post_delete, sender=Scope)
+@receiver(post_delete, sender=Publisher)
+@receiver(post_delete, sender=Profile)
+def delete_schema_digest(sender, instance, **kwargs):
+    SchemaDigest.objects.filter(kind=sender._meta.model_name, object_id=instance.pk).delete()
+    if sender is Scope:
+        update_table_auth_data(instance)
+
+
+@receiver(post_save, sender=ChangelogItem)
+def notify_changelog_feed(sender, instance: ChangelogItem, created=False, **kwargs):
+    """Wake up the open changelog feeds"""
+    if created:
+        get_broker().notify()
@@ -20,6 +20,8 @@ router.register(r"/changelog", views.ChangelogViewSet, basename="changelog")
 
 urlpatterns = [
     path("status", views.RootView.as_view()),
+    # Before the router, which would take "feed" for a dataset name
+    path("v1/changelog/feed", views.ChangelogFeedView.as_view(), name="changelog-feed"),
     path("v1", include(router.urls)),
     path("", RedirectView.as_view(url="v1", permanent=True)),
     path(
@@ -1,6 +1,13 @@
+import hashlib
+import json
+
+from schematools.contrib.django.loaders import DatabaseSchemaLoader
+from schematools.exceptions import ScopeNotFound
 from schematools.naming import to_snake_case
 from schematools.types import DatasetSchema
 
+from .renderers import ORJSONRenderer
+
 
 def simplify_json(schema: DatasetSchema):
     """Constructs reference to replace inlined table"""
@@ -18,3 +25,128 @@ def simplify_json(schema: DatasetSchema):
         schema_json["versions"][vmajor]["tables"] = tables_ref
 
     return schema_json
+
+
+def content_hash(schema_data: str) -> str:
+    """Fingerprint of the stored schema contents"""
+    return hashlib.sha256(schema_data.encode()).hexdigest()
+
+
+def make_etag(*parts) -> str:
+    """Hash of the JSON encoded parts that determine the contents of a response"""
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+
+def filter_dataset_schema(
+    schema: DatasetSchema, tables: list[str] | None = None, scopes: list[str] | None = None
+) -> DatasetSchema:
+    """Apply the table and scope filtering of the API on a copy of the schema"""
+    if not tables and not scopes:
+        return schema
+
+    # DatasetSchema.json(inline_tables=True) writes the inlined tables back into the
+    # versions of the schema it is called on. The schema can be shared by the schema cache,
+    # so the filtering is done on a copy. The fresh loader makes sure the scopes are
+    # resolved against the current Scope table.
+    schema_json = schema.data.copy()
+    schema_json["versions"] = {
+        vmajor: vdata.copy() for vmajor, vdata in schema_json["versions"].items()
+    }
+    schema = DatasetSchema.from_dict(
+        schema_json, loader=DatabaseSchemaLoader(), view_sql=schema.view_sql
+    )
+
+    if tables:
+        schema = DatasetSchema.filter_on_tables(schema, tables)
+
+    if scopes:
+        schema = DatasetSchema.filter_on_scopes(schema, scopes)
+
+    return schema
+
+
+def render_json(data) -> str:
+    """JSON exactly as the API renders it"""
+    return ORJSONRenderer().render(data).decode()
+
+
+def render_dataset_documents(
+    schema: DatasetSchema,
+) -> tuple[str, dict[str, str], dict[tuple[str, str], str]]:
+    """
+    The JSON of the dataset, each version and each table as the unfiltered detail
+    views return them. Tables are keyed on (vmajor, snake_case table id).
+    """
+    versions = {}
+    tables = {}
+    for vmajor, version in schema.versions.items():
+        versions[vmajor] = render_json(version.json_data())
+
+        # Through tables are left out, as they depend on the related dataset too.
+        # The views find these by parsing the schema.
+        for table in [*version.tables, *version.nested_tables]:
+            # The first match wins, like get_table_by_id()
+            tables.setdefault((vmajor, to_snake_case(table.id)), render_json(table.json_data()))
+
+    return render_json(schema), versions, tables
+
+
+def scope_ids(schema_object) -> list[str]:
+    """The ids of the scopes of a dataset, table or field, resolved like schematools does"""
+    return sorted(scope.id for scope in schema_object.scopes)
+
+
+def render_table_auth_data(schema: DatasetSchema) -> dict[tuple[str, str], dict]:
+    """
+    The auth metadata that filter_table_document() needs for each table of the dataset,
+    keyed like the tables of render_dataset_documents(). Nested tables are not included,
+    their existence depends on the fields of the parent table.
+
+    When a scope doesn't exist, nothing is returned. The views then filter the whole
+    dataset, which raises ScopeNotFound just like the dataset views do.
+    """
+    # Resolve the scopes against the current Scope table, like filter_dataset_schema()
+    schema = DatasetSchema(schema.data, schema.view_sql, loader=DatabaseSchemaLoader())
+    auth_data = {}
+    try:
+        dataset_auth = scope_ids(schema)
+        for vmajor, version in schema.versions.items():
+            for table in version.tables:
+                auth_data.setdefault(
+                    (vmajor, to_snake_case(table.id)),
+                    {
+                        "dataset": dataset_auth,
+                        "table": scope_ids(table),
+                        "fields": [
+                            [field.id, scope_ids(field), field.json_data()]
+                            for field in table.fields
+                        ],
+                    },
+                )
+    except ScopeNotFound:
+        return {}
+
+    return auth_data
+
+
+def filter_table_document(schema_data: str, auth_data: dict, scopes: list[str]) -> dict:
+    """
+    Apply scope filtering to a stored table, with the same outcome as filtering
+    the whole dataset with DatasetSchema.filter_on_scopes() and taking the table from it.
+    The scopes are ids like get_filter_params() returns them, compared to the scope ids
+    exactly like schematools compares them.
+    """
+    requested = set(scopes) | {"OPENBAAR"}
+    table_json = json.loads(schema_data)
+
+    # No fields at all without access to both the dataset and the table
+    if requested.isdisjoint(auth_data["dataset"]) or requested.isdisjoint(auth_data["table"]):
+        table_json["schema"]["properties"] = {}
+    else:
+        table_json["schema"]["properties"] = {
+            field_id: field_json
+            for field_id, field_auth, field_json in auth_data["fields"]
+            if not requested.isdisjoint(field_auth)
+        }
+
+    return table_json
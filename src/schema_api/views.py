@@ -1,10 +1,24 @@
-from django.http import JsonResponse
+import time
+from datetime import date, datetime, timedelta
+
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, DateField, Max
+from django.db.models.functions import Trunc
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.views import View
 from drf_spectacular.utils import extend_schema_view
 from rest_framework import viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from schematools.contrib.django.loaders import DatabaseSchemaLoader
 from schematools.contrib.django.models import Dataset, Profile, Publisher, Scope
 from schematools.exceptions import DatasetTableNotFound, DatasetVersionNotFound
 from schematools.naming import to_snake_case
@@ -12,9 +26,33 @@ from schematools.types import DatasetSchema
 
 import schema_api.openapi.schema as schema
 
-from .models import ChangelogItem
-from .serializers import ChangelogItemSerializer
-from .utils import simplify_json
+from .cache import (
+    changelog_aggregates_cache_key,
+    dataset_schema_cache,
+    filter_signature,
+    filtered_schema_cache_key,
+)
+from .feed import FeedStream, feed_connections, get_broker
+from .models import (
+    ChangelogItem,
+    DatasetDocument,
+    DatasetTableDocument,
+    DatasetVersionDocument,
+    SchemaDigest,
+)
+from .pagination import (
+    ChangelogCommitCursorPagination,
+    ChangelogCursorPagination,
+    DatasetCursorPagination,
+    is_cursor_request,
+)
+from .renderers import EventStreamRenderer, NDJSONRenderer, ORJSONRenderer
+from .serializers import (
+    ChangelogCommitValuesSerializer,
+    ChangelogItemSerializer,
+    ChangelogItemValuesSerializer,
+)
+from .utils import filter_dataset_schema, filter_table_document, make_etag
 
 
 class RootView(View):
@@ -24,7 +62,66 @@ class RootView(View):
         return JsonResponse({"status": "online"})
 
 
-class DatasetViewSet(viewsets.ReadOnlyModelViewSet):
+class ConditionalResponseMixin:
+    """
+    Adds strong ETag and Last-Modified validators based on the content hashes stored
+    at import time, so polling clients get a 304 before any schema is loaded.
+    """
+
+    validators = None
+
+    def get_not_modified_response(self, request, etag_parts, last_modified=None):
+        """
+        Store the validators for this response, and return a 304 response when the client
+        already has the current version. The rendered format is part of the ETag,
+        as the JSON and browsable API representations differ.
+        """
+        etag = quote_etag(make_etag(*etag_parts, request.accepted_renderer.format))
+        self.validators = (etag, last_modified)
+        return get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.validators is not None and response.status_code in (200, 304):
+            etag, last_modified = self.validators
+            response.headers["ETag"] = etag
+            if last_modified is not None:
+                response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+
+class NDJSONExportMixin:
+    """
+    Lists can be exported as NDJSON with ?_format=ndjson or Accept: application/x-ndjson.
+    The export is not paginated, but streamed from a server-side cursor in constant memory.
+    """
+
+    export_chunk_size = 100
+
+    def is_export(self, request) -> bool:
+        return request.accepted_renderer.format == NDJSONRenderer.format
+
+    def get_export_response(self, items) -> StreamingHttpResponse:
+        renderer = NDJSONRenderer()
+        return StreamingHttpResponse(
+            (renderer.render_line(item) for item in items), content_type=renderer.media_type
+        )
+
+    def export_queryset(self, queryset, to_representation=None) -> StreamingHttpResponse:
+        """Export the queryset rows, which are stored JSON unless to_representation is given"""
+        rows = queryset.iterator(chunk_size=self.export_chunk_size)
+        if to_representation is None:
+            return self.get_export_response(orjson.Fragment(row) for row in rows)
+        return self.get_export_response(to_representation(row) for row in rows)
+
+
+class DatasetViewSet(
+    ConditionalResponseMixin, NDJSONExportMixin, viewsets.ReadOnlyModelViewSet
+):
     lookup_field = "name"
 
     def get_queryset(self):
@@ -32,58 +129,213 @@ class DatasetViewSet(viewsets.ReadOnlyModelViewSet):
 
     @schema.list_datasets_schema
     def list(self, request):
-        queryset = self.get_queryset()
+        documents = DatasetDocument.objects.order_by("dataset__ordering", "dataset__name")
+
+        # Any added, removed or changed dataset changes the ETag of every page
+        state = list(documents.values_list("dataset_id", "content_hash"))
+        last_modified = documents.aggregate(Max("modified_at"))["modified_at__max"]
+        not_modified = self.get_not_modified_response(
+            request, [state, request.query_params.urlencode()], last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+
+        # The simplified JSON (tables replaced by a ref) is stored by import_schemas,
+        # so no DatasetSchema has to be constructed, and the renderer embeds it as-is.
+        queryset = documents.values_list("summary_data", flat=True)
+        if self.is_export(request):
+            return self.export_queryset(queryset)
+
+        if is_cursor_request(request):
+            paginator = DatasetCursorPagination()
+            page = paginator.paginate_queryset(
+                documents.values("dataset_id", "summary_data"), request, view=self
+            )
+            return paginator.get_paginated_response(
+                [orjson.Fragment(row["summary_data"]) for row in page]
+            )
+
         page = self.paginate_queryset(queryset)
         if page is not None:
-
-            # Simplify JSON by replacing inlined table with tabel ref
-            json_queryset = [simplify_json(dataset.schema) for dataset in page]
+            json_queryset = [orjson.Fragment(summary_data) for summary_data in page]
             return self.get_paginated_response(json_queryset)
 
-        json_queryset = [simplify_json(dataset.schema) for dataset in queryset]
+        json_queryset = [orjson.Fragment(summary_data) for summary_data in queryset]
         return Response(json_queryset)
 
-    @schema.retrieve_datasets_schema
-    def retrieve(self, request, name):
-        datasets = self.get_queryset()
-        dataset = get_object_or_404(datasets, name=to_snake_case(name))
-        dataset_schema = dataset.schema
+    def get_document(self, name: str) -> DatasetDocument | None:
+        """The stored state of the dataset, without the (large) summary"""
+        return DatasetDocument.objects.only("content_hash", "modified_at").filter(pk=name).first()
+
+    def get_dataset_schema(
+        self, name: str, content_hash: str | None, tables=None, scopes=None, schema_data=None
+    ) -> DatasetSchema:
+        """
+        Parsed schema of the dataset, reused from the worker cache while it is unchanged.
+        Filtered schemas are kept in the Django cache, so repeated filters are not
+        applied again. When the stored schema_data is already at hand it is parsed,
+        otherwise the Dataset is fetched.
+        """
+        if content_hash is None:
+            # Not imported yet by the current version, let the model decide
+            dataset = get_object_or_404(self.get_queryset(), name=name)
+            return filter_dataset_schema(dataset.schema, tables, scopes)
+
+        if tables or scopes:
+            cache_key = filtered_schema_cache_key(name, content_hash, tables, scopes)
+            filtered_data = cache.get(cache_key)
+            if filtered_data is not None:
+                return DatasetSchema.from_dict(filtered_data, loader=DatabaseSchemaLoader())
+
+        dataset_schema = dataset_schema_cache.get(name, content_hash)
+        if dataset_schema is None:
+            if schema_data is None:
+                dataset = get_object_or_404(self.get_queryset(), name=name)
+                dataset_schema = dataset.schema
+                schema_data = dataset.schema_data
+            else:
+                dataset_schema = DatasetSchema.from_dict(
+                    orjson.loads(schema_data), loader=DatabaseSchemaLoader()
+                )
+            dataset_schema_cache.set(name, content_hash, dataset_schema, size=len(schema_data))
+
+        if tables or scopes:
+            dataset_schema = filter_dataset_schema(dataset_schema, tables, scopes)
+            cache.set(cache_key, dataset_schema.data, settings.FILTERED_SCHEMA_CACHE_TIMEOUT)
+
+        return dataset_schema
+
+    def get_filter_params(self, request) -> tuple:
+        """Read the ?tables= and ?scopes= filters, either one is None when not given"""
+        tables = scopes = None
 
         # Table filtering
         tables_param = request.query_params.get("tables")
         if tables_param:
             tables = tables_param.split(",")
-            dataset_schema = DatasetSchema.filter_on_tables(dataset_schema, tables)
 
         # Scope filtering
         scopes_param = request.query_params.get("scopes")
         if scopes_param:
             # Transform url safe scope ids to regular ids
             scopes = [scope.replace("_", "/").upper() for scope in scopes_param.split(",")]
-            dataset_schema = DatasetSchema.filter_on_scopes(dataset_schema, scopes)
+
+        return tables, scopes
+
+    def get_stored_json(self, queryset) -> orjson.Fragment | None:
+        """
+        The JSON that import_schemas stored for unfiltered requests,
+        which is sent as-is without building a schema object.
+        """
+        schema_data = queryset.values_list("schema_data", flat=True).first()
+        return orjson.Fragment(schema_data) if schema_data else None
+
+    def get_dataset_not_modified_response(self, request, document, tables, scopes):
+        if document is None:
+            return None
+
+        etag_parts = [document.content_hash, request.path, filter_signature(tables, scopes)]
+        return self.get_not_modified_response(request, etag_parts, document.modified_at)
+
+    @schema.retrieve_datasets_schema
+    def retrieve(self, request, name):
+        name = to_snake_case(name)
+        tables, scopes = self.get_filter_params(request)
+        document = self.get_document(name)
+        not_modified = self.get_dataset_not_modified_response(request, document, tables, scopes)
+        if not_modified is not None:
+            return not_modified
+
+        if document is not None and not tables and not scopes:
+            stored_json = self.get_stored_json(DatasetDocument.objects.filter(pk=name))
+            if stored_json is not None:
+                return Response(stored_json)
+
+        dataset_schema = self.get_dataset_schema(
+            name, document and document.content_hash, tables, scopes
+        )
 
         return Response(dataset_schema)
 
+    # Being a list route, this comes before the dataset detail routes:
+    # a dataset named "bulk" can't be retrieved by its name.
+    @schema.retrieve_datasets_bulk_schema
+    @action(detail=False, url_path="bulk")
+    def bulk(self, request):
+        names_param = request.query_params.get("names")
+        if not names_param:
+            return Response(status=400, data={"detail": "Parameter 'names' is required."})
+
+        # The array is streamed as JSON, there is no NDJSON export of it
+        if self.is_export(request):
+            return Response(status=406, data={"detail": "Datasets are only returned as JSON."})
+
+        names = [to_snake_case(name) for name in names_param.split(",")]
+        tables, scopes = self.get_filter_params(request)
+        documents = DatasetDocument.objects.filter(pk__in=names).order_by(
+            "dataset__ordering", "dataset__name"
+        )
+
+        # Like retrieve(), an unknown dataset is a 404 rather than a shorter array
+        missing = set(names).difference(documents.values_list("dataset_id", flat=True))
+        if missing:
+            return Response(
+                status=404,
+                data={"detail": f"Datasets not found: {', '.join(sorted(missing))}."},
+            )
+
+        if tables or scopes:
+            # Filtering can fail (e.g. on an unknown scope), which has to happen before
+            # the response starts. Only the filtered datasets are kept in memory.
+            renderer = ORJSONRenderer()
+            rows = documents.values_list("dataset_id", "content_hash", "schema_data")
+            datasets = [
+                renderer.render(
+                    self.get_dataset_schema(
+                        name, content_hash, tables, scopes, schema_data=schema_data
+                    )
+                )
+                for name, content_hash, schema_data in rows.iterator(chunk_size=20)
+            ]
+        else:
+            # The stored JSON is sent as-is, fetched in small chunks so only a few
+            # datasets are in memory at the same time.
+            rows = documents.values_list("schema_data", flat=True)
+            datasets = (schema_data.encode() for schema_data in rows.iterator(chunk_size=20))
+
+        return StreamingHttpResponse(
+            self.stream_json_array(datasets), content_type="application/json"
+        )
+
+    def stream_json_array(self, items):
+        """Write the already rendered items as a JSON array"""
+        yield b"["
+        for i, item in enumerate(items):
+            if i:
+                yield b","
+            yield item
+        yield b"]"
+
     @schema.retrieve_datasets_schema_v
     @action(detail=True, url_path=r"(?P<vmajor>v\d{1,3})")
     def version(self, request, name, vmajor):
-        datasets = self.get_queryset()
-        dataset = get_object_or_404(datasets, name=to_snake_case(name))
-        dataset_schema = dataset.schema
-
-        # Table filtering
-        tables_param = request.query_params.get("tables")
-        if tables_param:
-            tables = tables_param.split(",")
-            dataset_schema = DatasetSchema.filter_on_tables(dataset_schema, tables)
-
-        # Scope filtering
-        scopes_param = request.query_params.get("scopes")
-        if scopes_param:
-
-            # Transform url safe scope ids to regular ids
-            scopes = [scope.replace("_", "/").upper() for scope in scopes_param.split(",")]
-            dataset_schema = DatasetSchema.filter_on_scopes(dataset_schema, scopes)
+        name = to_snake_case(name)
+        tables, scopes = self.get_filter_params(request)
+        document = self.get_document(name)
+        not_modified = self.get_dataset_not_modified_response(request, document, tables, scopes)
+        if not_modified is not None:
+            return not_modified
+
+        if document is not None and not tables and not scopes:
+            stored_json = self.get_stored_json(
+                DatasetVersionDocument.objects.filter(dataset=name, vmajor=vmajor)
+            )
+            if stored_json is not None:
+                return Response(stored_json)
+
+        dataset_schema = self.get_dataset_schema(
+            name, document and document.content_hash, tables, scopes
+        )
 
         try:
             dataset_vmajor = dataset_schema.get_version(vmajor)
@@ -95,17 +347,31 @@ class DatasetViewSet(viewsets.ReadOnlyModelViewSet):
     @schema.retrieve_datasets_schema_v_t
     @action(detail=True, url_path=r"(?P<vmajor>v\d{1,3})/(?P<table_id>\w+)")
     def table(self, request, name, vmajor, table_id):
-        datasets = self.get_queryset()
-        dataset = get_object_or_404(datasets, name=to_snake_case(name))
-        dataset_schema = dataset.schema
-
-        # Scope filtering
-        scopes_param = request.query_params.get("scopes")
-        if scopes_param:
-
-            # Transform url safe scope ids to regular ids
-            scopes = [scope.replace("_", "/").upper() for scope in scopes_param.split(",")]
-            dataset_schema = DatasetSchema.filter_on_scopes(dataset_schema, scopes)
+        name = to_snake_case(name)
+        # Only scope filtering applies to a single table
+        _, scopes = self.get_filter_params(request)
+        document = self.get_document(name)
+        not_modified = self.get_dataset_not_modified_response(request, document, None, scopes)
+        if not_modified is not None:
+            return not_modified
+
+        if document is not None:
+            table_documents = DatasetTableDocument.objects.filter(
+                dataset=name, vmajor=vmajor, table_id=to_snake_case(table_id)
+            )
+            if not scopes:
+                stored_json = self.get_stored_json(table_documents)
+                if stored_json is not None:
+                    return Response(stored_json)
+            else:
+                # Scope filtering only needs the table itself, not the whole dataset
+                table_document = table_documents.values_list("schema_data", "auth_data").first()
+                if table_document is not None and table_document[1] is not None:
+                    return Response(filter_table_document(*table_document, scopes))
+
+        dataset_schema = self.get_dataset_schema(
+            name, document and document.content_hash, scopes=scopes
+        )
 
         try:
             dataset_vmajor = dataset_schema.get_version(vmajor)
@@ -118,9 +384,27 @@ class DatasetViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(dataset_table.json_data())
 
 
-class BaseViewSet(viewsets.ReadOnlyModelViewSet):
+class BaseViewSet(ConditionalResponseMixin, NDJSONExportMixin, viewsets.ReadOnlyModelViewSet):
+
+    def get_digests(self):
+        return SchemaDigest.objects.filter(kind=self.queryset.model._meta.model_name)
 
     def list(self, request):
+        digests = self.get_digests().order_by("object_id")
+        state = list(digests.values_list("object_id", "content_hash"))
+        last_modified = digests.aggregate(Max("modified_at"))["modified_at__max"]
+        not_modified = self.get_not_modified_response(
+            request, [state, request.query_params.urlencode()], last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+
+        if self.is_export(request):
+            # The stored schema_data is the JSON of the schema
+            return self.export_queryset(
+                self.queryset.order_by("pk").values_list("schema_data", flat=True)
+            )
+
         page = self.paginate_queryset(self.queryset)
         if page is not None:
             json_queryset = [item.schema for item in page]
@@ -130,6 +414,14 @@ class BaseViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(json_queryset)
 
     def retrieve(self, request, pk):
+        digest = self.get_digests().filter(object_id=pk).first()
+        if digest is not None:
+            not_modified = self.get_not_modified_response(
+                request, [digest.content_hash], digest.modified_at
+            )
+            if not_modified is not None:
+                return not_modified
+
         item = get_object_or_404(self.queryset, pk=pk)
 
         return Response(item.schema)
@@ -159,27 +451,140 @@ class ProfileViewSet(BaseViewSet):
     queryset = Profile.objects.all()
 
 
-class ChangelogViewSet(viewsets.ReadOnlyModelViewSet):
+class ChangelogViewSet(ConditionalResponseMixin, NDJSONExportMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = ChangelogItemSerializer
+    aggregate_fields = ["dataset_id", "operation", "status"]
+    aggregate_periods = ["day", "week", "month"]
 
     def get_queryset(self):
-        return ChangelogItem.objects.all().order_by("-committed_at")
+        return ChangelogItem.objects.all().order_by("-committed_at", "-id")
 
     def filter_on_query_params(self, request, queryset):
-
-        # For now there's only from_date, more can be added here
         date_param = request.query_params.getlist("from_date")
         if date_param:
-            return queryset.filter(committed_at__gte=date_param[0])
+            queryset = queryset.filter(committed_at__gte=date_param[0])
+
+        if to_date := request.query_params.get("to_date"):
+            try:
+                day_after = date.fromisoformat(to_date) + timedelta(days=1)
+            except ValueError:
+                raise ParseError("Parameter 'to_date' must be a date (YYYY-MM-DD).") from None
+            # The given day is included
+            queryset = queryset.filter(
+                committed_at__lt=datetime.combine(
+                    day_after, datetime.min.time(), tzinfo=timezone.get_current_timezone()
+                )
+            )
+
+        # Comma separated lists of values
+        for param in ("dataset_id", "operation", "status"):
+            if values := request.query_params.get(param):
+                queryset = queryset.filter(**{f"{param}__in": values.split(",")})
+
+        if object_id := request.query_params.get("object_id"):
+            queryset = queryset.filter(object_id__startswith=object_id)
+
+        if commit_hash := request.query_params.get("commit_hash"):
+            queryset = queryset.filter(commit_hash=commit_hash)
+
         return queryset
 
+    def get_changelog_not_modified_response(self, request, queryset):
+        # Changelog items are only added, and each new item gets a higher id,
+        # also when it's for an older commit. So the highest id identifies the contents.
+        latest = queryset.aggregate(last_id=Max("id"), last_modified=Max("created_at"))
+        return self.get_not_modified_response(
+            request,
+            [latest["last_id"], request.query_params.urlencode()],
+            latest["last_modified"],
+        )
+
     def return_paginated_list_response(self, queryset):
-        page = self.paginate_queryset(queryset)
+        not_modified = self.get_changelog_not_modified_response(self.request, queryset)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = ChangelogItemValuesSerializer()
+        rows = serializer.values(queryset)
+        if self.is_export(self.request):
+            return self.export_queryset(rows, serializer.to_representation)
+
+        if is_cursor_request(self.request):
+            paginator = ChangelogCursorPagination()
+            page = paginator.paginate_queryset(rows, self.request, view=self)
+            return paginator.get_paginated_response(
+                [serializer.to_representation(row) for row in page]
+            )
+
+        page = self.paginate_queryset(rows)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+            return self.get_paginated_response([serializer.to_representation(row) for row in page])
+        return Response([serializer.to_representation(row) for row in rows])
+
+    # The commits and aggregates actions are routed before the dataset action, which would
+    # also match their paths, as extra actions are routed in alphabetical order.
+    @schema.list_changelog_commits_schema
+    @action(detail=False, url_path="commits")
+    def commits(self, request):
+        """The changelog items grouped by commit, newest commit first"""
+        queryset = self.filter_on_query_params(request, ChangelogItem.objects.all())
+        not_modified = self.get_changelog_not_modified_response(request, queryset)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = ChangelogCommitValuesSerializer()
+        paginator = ChangelogCommitCursorPagination()
+        page = paginator.paginate_queryset(serializer.values(queryset), request, view=self)
+        return paginator.get_paginated_response(
+            [serializer.to_representation(commit) for commit in page]
+        )
+
+    @schema.changelog_aggregates_schema
+    @action(detail=False, url_path="aggregates")
+    def aggregates(self, request):
+        """Number of changelog items per period and group, counted by the database"""
+        group_by = request.query_params.get("group_by", ",".join(self.aggregate_fields))
+        group_by = group_by.split(",") if group_by else []
+        if not set(group_by) <= set(self.aggregate_fields):
+            fields = ", ".join(self.aggregate_fields)
+            raise ParseError(f"Parameter 'group_by' can contain: {fields}.")
+
+        period = request.query_params.get("period", "day")
+        if period not in self.aggregate_periods:
+            periods = ", ".join(self.aggregate_periods)
+            raise ParseError(f"Parameter 'period' must be one of: {periods}.")
+
+        latest = ChangelogItem.objects.aggregate(
+            last_id=Max("id"), last_modified=Max("created_at")
+        )
+        query_string = request.query_params.urlencode()
+        not_modified = self.get_not_modified_response(
+            request, [latest["last_id"], query_string], latest["last_modified"]
+        )
+        if not_modified is not None:
+            return not_modified
+
+        cache_key = changelog_aggregates_cache_key(latest["last_id"], query_string)
+        aggregates = cache.get(cache_key)
+        if aggregates is None:
+            queryset = self.filter_on_query_params(request, ChangelogItem.objects.all())
+            rows = (
+                queryset.annotate(
+                    period=Trunc(
+                        "committed_at",
+                        period,
+                        output_field=DateField(),
+                        tzinfo=timezone.get_current_timezone(),
+                    )
+                )
+                .values("period", *group_by)
+                .annotate(count=Count("id"))
+                .order_by("-period", *group_by)
+            )
+            aggregates = [{**row, "period": row["period"].isoformat()} for row in rows]
+            cache.set(cache_key, aggregates, settings.CHANGELOG_AGGREGATES_CACHE_TIMEOUT)
+
+        return Response(aggregates)
 
     @schema.list_changelog_schema
     def list(self, request):
@@ -200,3 +605,67 @@ class ChangelogViewSet(viewsets.ReadOnlyModelViewSet):
         queryset = self.get_queryset().filter(dataset_id=dataset)
         queryset = self.filter_on_query_params(request, queryset)
         return self.return_paginated_list_response(queryset)
+
+
+class ChangelogFeedView(APIView):
+    """
+    Server-Sent Events stream that pushes new changelog items as they are stored,
+    so clients don't have to poll the changelog.
+
+    The event ids are the ids of the changelog items. A client that reconnects with
+    the Last-Event-ID header (or ?last_id=) continues after the last item it received.
+    Without it, only items stored after connecting are sent.
+
+    The number of open feeds is limited per process, see CHANGELOG_FEED_MAX_CONNECTIONS.
+    """
+
+    renderer_classes = [EventStreamRenderer, ORJSONRenderer]
+    batch_size = 100
+
+    @schema.changelog_feed_schema
+    def get(self, request):
+        last_id = request.headers.get("Last-Event-ID", request.query_params.get("last_id"))
+        if last_id is None:
+            last_id = ChangelogItem.objects.aggregate(Max("id"))["id__max"] or 0
+        elif not last_id.isdigit():
+            return Response(status=400, data={"detail": "Parameter 'last_id' must be an id."})
+
+        if not feed_connections.acquire():
+            return Response(
+                status=503,
+                data={"detail": "Too many open feeds, try again later."},
+                headers={"Retry-After": str(settings.CHANGELOG_FEED_RETRY_AFTER)},
+            )
+
+        response = StreamingHttpResponse(
+            FeedStream(self.stream_events(int(last_id)), feed_connections),
+            content_type=EventStreamRenderer.media_type,
+        )
+        response.headers["Cache-Control"] = "no-cache"
+        # Don't let a proxy buffer the events
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
+    def stream_events(self, last_id: int):
+        renderer = EventStreamRenderer()
+        deadline = time.monotonic() + settings.CHANGELOG_FEED_MAX_DURATION
+
+        # Listen before querying, so no notification is missed in between
+        with get_broker().listen() as listener:
+            while True:
+                items = list(
+                    ChangelogItem.objects.filter(id__gt=last_id).order_by("id")[: self.batch_size]
+                )
+                for item in items:
+                    data = ChangelogItemSerializer(item).data
+                    yield renderer.render_event(data, event="changelog", event_id=item.pk)
+                    last_id = item.pk
+                if len(items) == self.batch_size:
+                    continue
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                if not listener.wait(min(settings.CHANGELOG_FEED_HEARTBEAT, remaining)):
+                    # Comment line, which keeps the connection open
+                    yield b": keep-alive\n\n"
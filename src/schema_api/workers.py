@@ -0,0 +1,19 @@
+"""
+Set up of the worker processes of the changelog command.
+
+The workers are started by the default multiprocessing context, which doesn't
+fork on every platform (forkserver is the default on Linux since Python 3.14).
+A fresh worker has no Django set up, and the command module can only be imported
+after that, since it imports the models. So the initializer lives here.
+"""
+
+import django
+
+
+def setup_changelog_worker(repository_path):
+    """Set up Django, then open the git repository the worker reads the commits from"""
+    django.setup()
+
+    from schema_api.management.commands import changelog
+
+    changelog._open_worker_repository(repository_path)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -7,6 +10,7 @@ from django.core.handlers.wsgi import WSGIRequest
 from django.core.management import call_command
 from rest_framework.request import Request
 from rest_framework.test import APIClient, APIRequestFactory
+from schema_api.cache import dataset_schema_cache
 from schema_api.models import ChangelogItem
 from schematools.loaders import FileSystemSchemaLoader
 
@@ -20,6 +24,12 @@ def here() -> Path:
     return HERE
 
 
+@pytest.fixture(autouse=True)
+def clear_dataset_schema_cache():
+    """The schema cache lives in the process, so it would leak between tests"""
+    dataset_schema_cache.clear()
+
+
 @pytest.fixture()
 def api_rf() -> APIRequestFactory:
     """Request factory for APIView classes"""
@@ -207,3 +217,40 @@ def changelog_items(here):
     ]
     for item in changelog_items:
         ChangelogItem.objects.create(**item)
+
+
+@pytest.fixture()
+def schema_repository(tmp_path, here) -> tuple[Path, list[str]]:
+    """
+    Git repository with 2 commits of the bomen dataset, the second updates a table
+    and adds the milieu dataset. The gebieden dataset doesn't change.
+    """
+    path = tmp_path / "amsterdam-schema"
+    changelog_files = here / "files/datasets/changelog"
+
+    def git(*args, date="2026-01-05T13:59:05+00:00"):
+        return subprocess.run(  # noqa: S603
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=path,
+            env={**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date},
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    (path / "datasets/bomen").mkdir(parents=True)
+    (path / "datasets/gebieden").mkdir(parents=True)
+    git("init", "--quiet", "--initial-branch=master")
+
+    shutil.copy(changelog_files / "base_dataset.json", path / "datasets/bomen/dataset.json")
+    shutil.copy(here / "files/datasets/gebieden.json", path / "datasets/gebieden/dataset.json")
+    git("add", ".")
+    git("commit", "--quiet", "-m", "Add datasets", date="2026-01-04T10:00:00+00:00")
+
+    shutil.copy(changelog_files / "update_table.json", path / "datasets/bomen/dataset.json")
+    (path / "datasets/milieu").mkdir()
+    shutil.copy(here / "files/datasets/milieu2025.json", path / "datasets/milieu/dataset.json")
+    git("add", ".")
+    git("commit", "--quiet", "-m", "Update bomen tables, add milieu")
+
+    return path, git("rev-list", "--reverse", "master").splitlines()
@@ -49,3 +49,6 @@ STORAGES = {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
     },
 }
+
+# The tests don't commit their transactions, so notifications are sent in-process
+CHANGELOG_FEED_BROKER = "schema_api.feed.LocalBroker"
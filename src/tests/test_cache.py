@@ -0,0 +1,136 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from schematools.types import DatasetSchema
+
+from schema_api.cache import DatasetSchemaCache, dataset_schema_cache, filtered_schema_cache_key
+from schema_api.models import ChangelogItem
+
+
+@pytest.fixture()
+def locmem_cache(settings):
+    """The test settings use the DummyCache, which never stores anything"""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+    yield cache
+    cache.clear()
+
+
+def make_schema(name: str) -> DatasetSchema:
+    return DatasetSchema.from_dict({"id": name, "type": "dataset", "versions": {}})
+
+
+def test_cache_hit_and_miss():
+    cache = DatasetSchemaCache(max_entries=10, max_size=1000)
+    schema = make_schema("bomen")
+    cache.set("bomen", "hash1", schema, size=10)
+
+    assert cache.get("bomen", "hash1") is schema
+    assert cache.get("bomen", "hash2") is None
+    assert cache.get("gebieden", "hash1") is None
+    assert cache.cache_info() == (1, 2, 1, 10)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = DatasetSchemaCache(max_entries=2, max_size=1000)
+    cache.set("a", "hash", make_schema("a"), size=10)
+    cache.set("b", "hash", make_schema("b"), size=10)
+    cache.get("a", "hash")
+    cache.set("c", "hash", make_schema("c"), size=10)
+
+    assert cache.get("b", "hash") is None
+    assert cache.get("a", "hash") is not None
+    assert cache.get("c", "hash") is not None
+
+
+def test_cache_evicts_on_size():
+    cache = DatasetSchemaCache(max_entries=10, max_size=100)
+    cache.set("a", "hash", make_schema("a"), size=60)
+    cache.set("b", "hash", make_schema("b"), size=60)
+    cache.set("c", "hash", make_schema("c"), size=200)
+
+    assert cache.get("a", "hash") is None
+    assert cache.get("b", "hash") is not None
+    assert cache.get("c", "hash") is None
+    assert cache.cache_info().size == 60
+
+
+@pytest.mark.django_db
+def test_dataset_views_use_cache(client, gebieden_dataset):
+    url = reverse("dataset-detail", kwargs={"name": "gebieden"})
+    response = client.get(url, query_params={"tables": "bouwblokken"})
+    assert len(response.data["versions"]["v1"]["tables"]) == 1
+    assert dataset_schema_cache.cache_info().misses == 1
+
+    # Filtering works on a copy, the cached schema keeps all tables
+    response = client.get(url, query_params={"tables": "buurten,wijken"})
+    assert len(response.data["versions"]["v1"]["tables"]) == 2
+    assert dataset_schema_cache.cache_info().hits == 1
+
+
+def test_filtered_schema_cache_key_is_canonical():
+    key = filtered_schema_cache_key("bomen", "hash", ["b", "a"], ["FP/MDW"])
+    assert key == filtered_schema_cache_key(
+        "bomen", "hash", ["a", "b", "a"], ["OPENBAAR", "FP/MDW"]
+    )
+    assert key != filtered_schema_cache_key("bomen", "hash2", ["a", "b"], ["FP/MDW"])
+    assert key != filtered_schema_cache_key("bomen", "hash", ["a"], ["FP/MDW"])
+
+
+@pytest.mark.django_db
+def test_filtered_schema_shared_between_views(client, bomen_dataset, scope_fixture, locmem_cache):
+    response = client.get(
+        reverse("dataset-detail", kwargs={"name": "bomen"}), query_params={"scopes": "fp_mdw"}
+    )
+    assert response.status_code == 200
+    assert dataset_schema_cache.cache_info().misses == 1
+
+    # The table view reuses the filtered schema, without touching the parsed schema
+    response = client.get(
+        reverse(
+            "dataset-table",
+            kwargs={"name": "bomen", "vmajor": "v2", "table_id": "groeiplaatsmedebeheer"},
+        ),
+        query_params={"scopes": "openbaar,fp_mdw"},
+    )
+    assert response.status_code == 200
+    assert "guid" in response.data["schema"]["properties"]
+    assert dataset_schema_cache.cache_info() == (0, 1, 1, dataset_schema_cache.cache_info().size)
+
+
+@pytest.mark.django_db
+def test_changelog_aggregates_cached_until_ingestion(client, changelog_items, locmem_cache):
+    url = reverse("changelog-aggregates")
+    assert client.get(url).json()[0]["count"] == 1
+
+    # Stored in the cache, so a change to an existing item is not seen
+    ChangelogItem.objects.filter(id=2).update(dataset_id="gebieden")
+    assert client.get(url).json()[0]["dataset_id"] == "hrKvk"
+
+    # A new item changes the key
+    ChangelogItem.objects.create(
+        id=4,
+        dataset_id="hrKvk",
+        status="stable",
+        object_id="hrKvk/v1/functievervullingen",
+        operation="update",
+        commit_hash="OTHER_COMMIT_HASH",
+        committed_at="2026-01-02T15:36:05+01:00",
+    )
+    assert client.get(url).json()[:2] == [
+        {
+            "period": "2026-01-02",
+            "dataset_id": "gebieden",
+            "operation": "update",
+            "status": "stable",
+            "count": 1,
+        },
+        {
+            "period": "2026-01-02",
+            "dataset_id": "hrKvk",
+            "operation": "update",
+            "status": "stable",
+            "count": 1,
+        },
+    ]
@@ -1,14 +1,32 @@
+import json
+import subprocess
 import sys
 from datetime import datetime, timezone
 
 import pytest
 from django.core.management import call_command
-from schema_api.models import ChangelogItem
+from django.db import IntegrityError, transaction
+from schema_api.models import ChangelogItem, ChangelogRun
 from schematools.types import DatasetSchema
 
 sys.path.append("..")
 
-from schema_api.management.commands.changelog import extract_diffs_for_dataset
+from schema_api.git import (
+    GitRepository,
+    changed_dataset_dirs,
+    find_dataset_dirs,
+    touched_dataset_dirs,
+    update_mirror,
+)
+from schema_api.management.commands import changelog
+from schema_api.management.commands.changelog import (
+    DatasetCarry,
+    collect_changelog_items,
+    compare_schemas,
+    extract_diffs_for_dataset,
+    process_commit,
+    write_changelog_items,
+)
 
 
 class TestChangelogCommand:
@@ -236,3 +254,250 @@ class TestChangelogCommand:
         db_updates = extract_diffs_for_dataset(diffs, patch_dataset)
 
         assert db_updates == []
+
+
+@pytest.mark.django_db
+class TestChangelogItem:
+
+    def test_changelog_item_identity(self):
+        """
+        Test that an item is only stored once, also when the same commit time
+        is given in another timezone.
+        """
+        values = {
+            "dataset_id": "gebieden",
+            "status": "stable",
+            "object_id": "gebieden/v1/bouwblokken",
+            "operation": "update",
+            "commit_hash": "abcd",
+        }
+        item = ChangelogItem.objects.create(**values, committed_at="2026-01-02T14:36:05+01:00")
+        duplicate = ChangelogItem(
+            **values, committed_at=datetime(2026, 1, 2, 13, 36, 5, tzinfo=timezone.utc)
+        )
+        assert duplicate.compute_identity() == item.identity
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            duplicate.save()
+
+        ChangelogItem.objects.create(**values, committed_at="2026-01-02T14:36:06+01:00")
+        assert ChangelogItem.objects.count() == 2
+
+    def test_write_changelog_items(self, capsys, django_capture_on_commit_callbacks):
+        """Only the rows that were really inserted are counted, printed and notified"""
+        values = {
+            "dataset_id": "gebieden",
+            "status": "stable",
+            "operation": "update",
+            "commit_hash": "abcd",
+            "committed_at": datetime(2026, 1, 2, 13, 36, 5, tzinfo=timezone.utc),
+        }
+
+        def make_items():
+            items = [
+                ChangelogItem(**values, object_id=f"gebieden/v1/{table}")
+                for table in ["bouwblokken", "buurten", "wijken"]
+            ]
+            for item in items:
+                item.set_computed_fields()
+            return items
+
+        # Rows of the same batch that were stored before, e.g. by another run
+        ChangelogItem.objects.create(**values, object_id="gebieden/v1/bouwblokken")
+        ChangelogItem.objects.create(**values, object_id="gebieden/v1/wijken")
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            assert write_changelog_items(make_items(), verbosity=2) == 1
+        assert len(callbacks) == 1
+        assert capsys.readouterr().out.splitlines() == [
+            "* Update table gebieden/v1/buurten. (2026-01-02 13:36:05+00:00)"
+        ]
+        assert ChangelogItem.objects.count() == 3
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            assert write_changelog_items(make_items()) == 0
+        assert not callbacks
+        assert capsys.readouterr().out == ""
+
+
+class TestGitRepository:
+
+    def test_read_file(self, schema_repository):
+        path, commits = schema_repository
+        with GitRepository(path) as repository:
+            contents = repository.read_file(commits[0], "datasets/bomen/dataset.json")
+            assert json.loads(contents)["id"] == "bomen"
+            assert repository.read_file(commits[0], "datasets/bomen/missing.json") is None
+
+            # The same process serves the next request
+            contents = repository.read_file(commits[1], "datasets/gebieden/dataset.json")
+            assert json.loads(contents)["id"] == "gebieden"
+
+            assert repository.commit_time(commits[1]) == datetime(
+                2026, 1, 5, 13, 59, 5, tzinfo=timezone.utc
+            )
+
+    def test_compare_schemas(self, schema_repository, base_dataset, update_table):
+        """Only the changed dataset is read, and diffed like the checked out files were"""
+        path, commits = schema_repository
+        with GitRepository(path) as repository:
+            dataset_diffs = compare_schemas(repository, commits[0], commits[1])
+
+        assert [dataset.id for dataset in dataset_diffs] == ["bomen"]
+        assert list(dataset_diffs.values()) == [
+            extract_diffs_for_dataset(base_dataset.get_diffs(update_table), update_table)
+        ]
+
+    def test_compare_schemas_carry(self, schema_repository, base_dataset, update_table):
+        """The parsed datasets of the update commit are reused as the next base"""
+        path, commits = schema_repository
+        carry = DatasetCarry()
+        with GitRepository(path) as repository:
+            dataset_diffs = compare_schemas(repository, commits[0], commits[1], carry)
+            (update_ds,) = dataset_diffs
+
+            # Unchanged folder, same tree id: nothing is read again
+            datasets = carry.load(repository, commits[1], {"datasets/bomen"})
+            assert next(iter(datasets.values())) is update_ds
+
+            # The bomen folder of the base commit has another tree id
+            datasets = carry.load(repository, commits[0], {"datasets/bomen"})
+            assert next(iter(datasets.values())) is not update_ds
+
+        assert list(dataset_diffs.values()) == [
+            extract_diffs_for_dataset(base_dataset.get_diffs(update_table), update_table)
+        ]
+
+    @pytest.mark.django_db
+    def test_process_commit(self, schema_repository):
+        """Items are inserted once, a rerun skips them"""
+        path, commits = schema_repository
+        with GitRepository(path) as repository:
+            assert process_commit(repository, commits[0], commits[1]) == (2, 0)
+            assert process_commit(repository, commits[0], commits[1]) == (0, 2)
+
+        assert list(
+            ChangelogItem.objects.order_by("object_id").values_list("object_id", "description")
+        ) == [
+            ("bomen/v1/groeiplaatsmedebeheer", "Update table bomen/v1/groeiplaatsmedebeheer."),
+            ("bomen/v2/groeiplaatsmedebeheer", "Update table bomen/v2/groeiplaatsmedebeheer."),
+        ]
+
+    @pytest.mark.django_db
+    def test_extend_changelog_table_checkpoint(self, schema_repository):
+        """The run records the last processed commit, the next run starts there"""
+        path, commits = schema_repository
+
+        changelog.extend_changelog_table(path, commits[0], "HEAD")
+
+        run = ChangelogRun.objects.get()
+        assert run.finished_at is not None
+        assert (run.last_commit, run.commits_processed) == (commits[1], 1)
+        assert (run.items_inserted, run.items_skipped) == (2, 0)
+        assert ChangelogItem.objects.count() == 2
+        assert changelog._get_most_recent_commit() == commits[1]
+
+    @pytest.mark.django_db
+    def test_changelog_command_mirror(self, schema_repository, tmp_path, settings):
+        """The command clones a mirror of the local repository, and continues from its run"""
+        path, commits = schema_repository
+        settings.CHANGELOG_REPOSITORY_URL = str(path)
+        settings.CHANGELOG_REPOSITORY_DIR = str(tmp_path / "mirror.git")
+
+        call_command("changelog", "--start_commit", commits[0])
+        assert ChangelogItem.objects.filter(commit_hash=commits[1]).count() == 2
+
+        call_command("changelog")
+        assert ChangelogRun.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_changelog_command_range_run(self, schema_repository, tmp_path, settings):
+        """Reprocessing an older range doesn't move the start of the next run back"""
+        path, commits = schema_repository
+        settings.CHANGELOG_REPOSITORY_URL = str(path)
+        settings.CHANGELOG_REPOSITORY_DIR = str(tmp_path / "mirror.git")
+        subprocess.run(  # noqa: S603
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            + ["commit", "--quiet", "--allow-empty", "-m", "Nothing changed"],
+            cwd=path,
+            check=True,
+        )
+        head = GitRepository(path).run("rev-parse", "HEAD").strip()
+
+        changelog.extend_changelog_table(path, commits[0], "HEAD")
+        call_command("changelog", "--start_commit", commits[0], "--end_commit", commits[1])
+        assert list(
+            ChangelogRun.objects.order_by("id").values_list("last_commit", "incremental")
+        ) == [
+            (head, True),
+            (commits[1], False),
+        ]
+
+        assert changelog._get_most_recent_commit() == head
+        call_command("changelog")
+        assert ChangelogRun.objects.count() == 2
+
+    def test_collect_changelog_items_workers(self, schema_repository):
+        """A pool of workers gives the same items, in the order of the commits"""
+        path, commits = schema_repository
+        commit_pairs = [(commits[0], commits[1]), (commits[1], commits[1])]
+
+        results = [
+            [
+                [item.identity for item in items]
+                for items in collect_changelog_items(path, commit_pairs, workers)
+            ]
+            for workers in (1, 2)
+        ]
+        assert len(results[0][0]) == 2
+        assert results[0] == results[1] == [results[0][0], []]
+
+    def test_changed_dataset_dirs(self, schema_repository):
+        """Unchanged and newly added datasets are left out"""
+        path, commits = schema_repository
+        with GitRepository(path) as repository:
+            assert repository.changed_files(commits[0], commits[1], "datasets") == [
+                "datasets/bomen/dataset.json",
+                "datasets/milieu/dataset.json",
+            ]
+            assert changed_dataset_dirs(repository, commits[0], commits[1]) == {
+                "datasets/bomen"
+            }
+            assert changed_dataset_dirs(repository, commits[1], commits[1]) == set()
+
+    def test_update_mirror(self, schema_repository, tmp_path):
+        """The mirror is cloned once, after that new commits are fetched"""
+        path, commits = schema_repository
+        mirror_path = tmp_path / "mirror.git"
+        update_mirror(str(path), mirror_path)
+        with GitRepository(mirror_path) as mirror:
+            assert mirror.commits_between(commits[0], "HEAD") == commits
+
+        subprocess.run(  # noqa: S603
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            + ["-C", str(path), "commit", "--quiet", "--allow-empty", "-m", "Empty"],
+            check=True,
+        )
+        update_mirror(str(path), mirror_path)
+        with GitRepository(mirror_path) as mirror:
+            new_commits = mirror.commits_between(commits[1], "HEAD")
+        assert len(new_commits) == 2
+        assert new_commits[0] == commits[1]
+
+    def test_touched_dataset_dirs(self):
+        dataset_dirs = find_dataset_dirs(
+            [
+                "datasets/bomen/dataset.json",
+                "datasets/bomen/stamgegevens/v1.0.0.json",
+                "datasets/hr/dataset.json",
+                "datasets/hr/kvk/dataset.json",
+                "datasets/README.md",
+            ]
+        )
+        assert dataset_dirs == {"datasets/bomen", "datasets/hr", "datasets/hr/kvk"}
+
+        changed_files = ["datasets/bomen/stamgegevens/v1.0.0.json", "datasets/hr/kvk/v1.json"]
+        assert touched_dataset_dirs(dataset_dirs, changed_files) == {
+            "datasets/bomen",
+            "datasets/hr/kvk",
+        }
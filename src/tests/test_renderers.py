@@ -0,0 +1,33 @@
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+from schema_api.renderers import ORJSONRenderer
+
+
+def test_renderer_output_matches_json_renderer():
+    data = {
+        "id": "gebieden",
+        "title": "Gebieden   Amsterdam",
+        "committed_at": datetime(2025, 11, 4, 13, 36, 5, 123456, tzinfo=UTC),
+        "ratio": Decimal("1.5"),
+        "tables": [{"id": "buurten", "count": 3, "active": True, "parent": None}],
+    }
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renderer_indent():
+    data = {"id": "bomen", "tables": []}
+    rendered = ORJSONRenderer().render(data, "application/json; indent=4")
+    assert rendered.startswith(b"{\n")
+    assert json.loads(rendered) == data
+
+
+def test_renderer_passthrough():
+    assert ORJSONRenderer().render(b'{"id": "bomen"}') == b'{"id": "bomen"}'
+
+    data = {"count": 1, "results": [orjson.Fragment('{"id":"bomen"}')]}
+    assert ORJSONRenderer().render(data) == b'{"count":1,"results":[{"id":"bomen"}]}'
@@ -1,8 +1,23 @@
+import json
+import threading
+import time
 from datetime import date
+from pathlib import Path
 
 import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.dateparse import parse_datetime
+from schematools.contrib.django.models import Dataset, Scope
+from schematools.exceptions import ScopeNotFound
+
+from schema_api.cache import dataset_schema_cache
+from schema_api.feed import ConnectionLimit, FeedStream, PostgresBroker, feed_connections
+from schema_api.models import ChangelogItem, DatasetTableDocument
+from schema_api.utils import filter_dataset_schema, render_json, simplify_json
+from schema_api.views import ChangelogFeedView
 
 
 def test_root_view(client):
@@ -15,6 +30,17 @@ def test_root_view_redirect(client):
     assert response.status_code == 200
 
 
+def import_bomen_with_field_auth(here, tmp_path, auth):
+    """Import bomen with the groeiplaatsBoom field of v2 guarded by the auth"""
+    dataset_json = json.loads((here / "files/datasets/bomen.json").read_text())
+    table_json = dataset_json["versions"]["v2"]["tables"][0]
+    table_json["schema"]["properties"]["groeiplaatsBoom"]["auth"] = auth
+    dataset_path = tmp_path / "datasets/bomen.json"
+    dataset_path.parent.mkdir()
+    dataset_path.write_text(json.dumps(dataset_json))
+    call_command("import_schemas", dataset_path)
+
+
 @pytest.mark.django_db
 class TestDatasetViews:
 
@@ -22,12 +48,59 @@ class TestDatasetViews:
         response = client.get(reverse("dataset-list"))
         assert response.status_code == 200
 
+    def test_dataset_list_summary(self, client, bomen_dataset):
+        """The stored summary is identical to the simplified JSON of the dataset"""
+        response = client.get(reverse("dataset-list"))
+        assert response.status_code == 200
+        dataset = Dataset.objects.get(name="bomen")
+        assert response.json()["results"] == [simplify_json(dataset.schema)]
+
+    def test_dataset_list_cursor(
+        self, client, bomen_dataset, gebieden_dataset, milieu2025_dataset
+    ):
+        """Cursor pagination walks through all datasets by name, without a count"""
+        names = []
+        url = reverse("dataset-list", query={"cursor": "", "page_size": 2})
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            assert response.status_code == 200
+            assert not any("COUNT(" in query["sql"] for query in queries)
+
+            data = response.json()
+            assert "count" not in data
+            names += [dataset["id"] for dataset in data["results"]]
+            url = data["next"]
+
+        assert names == ["bomen", "gebieden", "milieuzones2025"]
+
     def test_dataset_detail(self, client, bomen_dataset):
         response = client.get(
             reverse("dataset-detail", kwargs={"name": "bomen"}),
         )
         assert response.status_code == 200
-        assert response.data["id"] == "bomen"
+        assert response.json()["id"] == "bomen"
+
+    def test_dataset_stored_json(self, client, gebieden_dataset):
+        """The stored documents are identical to the JSON of the parsed schema"""
+        dataset_schema = Dataset.objects.get(name="gebieden").schema
+        response = client.get(reverse("dataset-detail", kwargs={"name": "gebieden"}))
+        assert response.content == render_json(dataset_schema).encode()
+
+        response = client.get(
+            reverse("dataset-version", kwargs={"name": "gebieden", "vmajor": "v1"})
+        )
+        version_json = render_json(dataset_schema.get_version("v1").json_data())
+        assert response.content == version_json.encode()
+
+        table = dataset_schema.get_version("v1").get_table_by_id("bouwblokken")
+        response = client.get(
+            reverse(
+                "dataset-table",
+                kwargs={"name": "gebieden", "vmajor": "v1", "table_id": "bouwblokken"},
+            )
+        )
+        assert response.content == render_json(table.json_data()).encode()
 
     def test_dataset_detail_snake_case(self, client, milieu2025_dataset):
         """Ensure CamelCase dataset id is found (dataset id is snake_case in db)"""
@@ -35,7 +108,7 @@ class TestDatasetViews:
             reverse("dataset-detail", kwargs={"name": "milieuzones2025"}),
         )
         assert response.status_code == 200
-        assert response.data["id"] == "milieuzones2025"
+        assert response.json()["id"] == "milieuzones2025"
 
     def test_dataset_detail_filter_on_tables(self, client, gebieden_dataset):
         response = client.get(
@@ -66,7 +139,7 @@ class TestDatasetViews:
             reverse("dataset-version", kwargs={"name": "bomen", "vmajor": "v1"}),
         )
         assert response.status_code == 200
-        assert response.data["version"] == "1.3.5"
+        assert response.json()["version"] == "1.3.5"
 
     def test_dataset_version_filter_on_tables(self, client, gebieden_dataset):
         response = client.get(
@@ -98,7 +171,7 @@ class TestDatasetViews:
             ),
         )
         assert response.status_code == 200
-        assert response.data["id"] == "groeiplaatsmedebeheer"
+        assert response.json()["id"] == "groeiplaatsmedebeheer"
 
     def test_dataset_table_not_found(self, client, bomen_dataset):
         response = client.get(
@@ -256,6 +329,148 @@ class TestDatasetViews:
         assert response.status_code == 200
         assert "guid" not in response.data["schema"]["properties"]
 
+    def assert_table_filter_equals_dataset_filter(self, client, scopes) -> dict:
+        """Filter every table on the scopes, returns the v2 table as the API gave it"""
+        dataset_schema = Dataset.objects.get(name="bomen").schema
+        scope_ids = [scope.replace("_", "/").upper() for scope in scopes.split(",")]
+        filtered_schema = filter_dataset_schema(dataset_schema, scopes=scope_ids)
+
+        for vmajor, version in dataset_schema.versions.items():
+            for table in version.tables:
+                response = client.get(
+                    reverse(
+                        "dataset-table",
+                        kwargs={"name": "bomen", "vmajor": vmajor, "table_id": table.id},
+                        query={"scopes": scopes},
+                    )
+                )
+                assert response.status_code == 200
+                expected = filtered_schema.get_version(vmajor).get_table_by_id(table.id)
+                assert response.json() == expected.json_data()
+
+        # The dataset schema was never needed
+        assert dataset_schema_cache.cache_info().misses == 0
+        return response.json()
+
+    @pytest.mark.parametrize("scopes", ["openbaar", "fp_mdw", "openbaar,fp_mdw", "brk_ro"])
+    def test_dataset_table_scope_filter_equals_dataset_filter(
+        self, client, scope_fixture, bomen_dataset, scopes
+    ):
+        """Scope filtering on the stored table gives the same result as filtering the dataset"""
+        self.assert_table_filter_equals_dataset_filter(client, scopes)
+
+    def test_dataset_table_scope_filter_exact_scope_ids(
+        self, client, scope_fixture, here, tmp_path
+    ):
+        """The url safe form of a requested scope doesn't match a scope id with an underscore"""
+        scope_path = tmp_path / "fp_intern.json"
+        scope_path.write_text(
+            json.dumps({"type": "scope", "id": "FP_INTERN", "name": "Intern", "owner": {}})
+        )
+        call_command("import_scopes", scope_path)
+        import_bomen_with_field_auth(here, tmp_path, "FP_INTERN")
+
+        table_json = self.assert_table_filter_equals_dataset_filter(client, "fp_mdw,fp_intern")
+        assert "groeiplaatsBoom" not in table_json["schema"]["properties"]
+        assert "guid" in table_json["schema"]["properties"]
+
+    def test_dataset_table_scope_filter_scopes_imported_later(self, client, here, bomen_dataset):
+        """A dataset imported before its scopes gets the auth data of its tables afterwards"""
+        table_documents = DatasetTableDocument.objects.filter(dataset="bomen")
+        assert not table_documents.filter(auth_data__isnull=False).exists()
+
+        call_command(
+            "import_scopes", here / "files/scopes/fp_mdw.json", here / "files/scopes/openbaar.json"
+        )
+        assert not table_documents.filter(auth_data__isnull=True).exists()
+        self.assert_table_filter_equals_dataset_filter(client, "fp_mdw")
+
+    def test_dataset_table_scope_filter_scope_changed(
+        self, client, here, scope_fixture, bomen_dataset
+    ):
+        """Removing or adding a scope refreshes the auth data of the tables that use it"""
+        url = reverse(
+            "dataset-table",
+            kwargs={"name": "bomen", "vmajor": "v2", "table_id": "groeiplaatsmedebeheer"},
+            query={"scopes": "fp_mdw"},
+        )
+        Scope.objects.filter(id="fp_mdw").delete()
+        with pytest.raises(ScopeNotFound):
+            client.get(url)
+
+        call_command("import_scopes", here / "files/scopes/fp_mdw.json")
+        dataset_schema_cache.clear()
+        self.assert_table_filter_equals_dataset_filter(client, "fp_mdw")
+
+    def test_dataset_table_scope_filter_unknown_scope(
+        self, client, scope_fixture, here, tmp_path
+    ):
+        """A scope that doesn't exist raises, for a single table like for the dataset"""
+        import_bomen_with_field_auth(here, tmp_path, "ONBEKEND")
+
+        urls = [
+            reverse("dataset-detail", kwargs={"name": "bomen"}, query={"scopes": "fp_mdw"}),
+            reverse(
+                "dataset-table",
+                kwargs={"name": "bomen", "vmajor": "v2", "table_id": "groeiplaatsmedebeheer"},
+                query={"scopes": "fp_mdw"},
+            ),
+        ]
+        for url in urls:
+            with pytest.raises(ScopeNotFound):
+                client.get(url)
+
+
+@pytest.mark.django_db
+class TestDatasetBulkView:
+    @pytest.mark.parametrize("query", [{}, {"scopes": "fp_mdw"}, {"tables": "bouwblokken"}])
+    def test_dataset_bulk(self, client, scope_fixture, bomen_dataset, gebieden_dataset, query):
+        """Every dataset in the response is the same as when it's retrieved on its own"""
+        response = client.get(
+            reverse("dataset-bulk"),
+            query_params={"names": "gebieden,bomen", **query},
+        )
+        assert response.status_code == 200
+        datasets = json.loads(b"".join(response.streaming_content))
+
+        assert [dataset["id"] for dataset in datasets] == ["bomen", "gebieden"]
+        for dataset in datasets:
+            response = client.get(
+                reverse("dataset-detail", kwargs={"name": dataset["id"]}), query_params=query
+            )
+            assert dataset == response.json()
+
+    def test_dataset_bulk_names_required(self, client):
+        response = client.get(reverse("dataset-bulk"))
+        assert response.status_code == 400
+
+    def test_dataset_bulk_unknown_names(self, client, bomen_dataset):
+        """Unknown names are a 404 like retrieve(), not silently left out"""
+        response = client.get(
+            reverse("dataset-bulk"), query_params={"names": "bomen,onbekend,ook_onbekend"}
+        )
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Datasets not found: onbekend, ook_onbekend."}
+
+    def test_dataset_bulk_unknown_scope(self, client, scope_fixture, here, tmp_path):
+        """A failing filter raises before the response starts, like retrieve()"""
+        import_bomen_with_field_auth(here, tmp_path, "ONBEKEND")
+        with pytest.raises(ScopeNotFound):
+            client.get(
+                reverse("dataset-bulk"), query_params={"names": "bomen", "scopes": "fp_mdw"}
+            )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"query_params": {"names": "bomen", "_format": "ndjson"}},
+            {"query_params": {"names": "bomen"}, "headers": {"Accept": "application/x-ndjson"}},
+        ],
+    )
+    def test_dataset_bulk_json_only(self, client, bomen_dataset, kwargs):
+        response = client.get(reverse("dataset-bulk"), **kwargs)
+        assert response.status_code == 406
+
 
 @pytest.mark.django_db
 class TestScopeViews:
@@ -302,6 +517,99 @@ class TestProfileViews:
         assert response.data["id"] == "brkdataportaalgebruiker"
 
 
+@pytest.mark.django_db
+class TestConditionalRequests:
+    def test_dataset_detail_not_modified(self, client, bomen_dataset, scope_fixture):
+        url = reverse("dataset-detail", kwargs={"name": "bomen"})
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["Last-Modified"]
+        etag = response.headers["ETag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert dataset_schema_cache.cache_info().misses == 0
+
+        response = client.get(
+            url, query_params={"scopes": "fp_mdw"}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_dataset_etag_changes_on_update(self, client, bomen_dataset):
+        url = reverse("dataset-version", kwargs={"name": "bomen", "vmajor": "v1"})
+        etag = client.get(url).headers["ETag"]
+
+        # Saving the same contents again is not a modification
+        dataset = Dataset.objects.get(name="bomen")
+        dataset.save()
+        assert client.get(url).headers["ETag"] == etag
+
+        schema_data = json.loads(dataset.schema_data)
+        schema_data["description"] = "Bomen in Amsterdam"
+        dataset.schema_data = json.dumps(schema_data)
+        dataset.save()
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_dataset_list_not_modified(self, client, bomen_dataset):
+        url = reverse("dataset-list")
+        etag = client.get(url).headers["ETag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        call_command("import_schemas", Path(__file__).parent / "files/datasets/gebieden.json")
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+    def test_scope_not_modified(self, client, scope_fixture):
+        url = reverse("scope-detail", kwargs={"pk": "fp_mdw"})
+        response = client.get(url)
+        response = client.get(
+            url, headers={"If-Modified-Since": response.headers["Last-Modified"]}
+        )
+        assert response.status_code == 304
+
+        etag = client.get(reverse("scope-list")).headers["ETag"]
+        response = client.get(reverse("scope-list"), headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_changelog_not_modified(self, client, changelog_items):
+        """A 304 only takes the aggregate query, until an item is added"""
+        url = reverse("changelog-dataset", kwargs={"dataset": "hrKvk"})
+        response = client.get(url)
+        assert response.headers["Last-Modified"]
+        etag = response.headers["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert len(queries) == 1
+
+        response = client.get(
+            url, headers={"If-Modified-Since": client.get(url).headers["Last-Modified"]}
+        )
+        assert response.status_code == 304
+
+        # Other datasets and parameters have their own ETag
+        other_url = reverse("changelog-dataset", kwargs={"dataset": "civieleconstructies"})
+        assert client.get(other_url, headers={"If-None-Match": etag}).status_code == 200
+        response = client.get(url, query_params={"page": 1}, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+        # An item for an older commit, processed later, is still a modification
+        ChangelogItem.objects.create(
+            id=4,
+            dataset_id="hrKvk",
+            status="stable",
+            object_id="hrKvk/v1/functievervullingen",
+            operation="update",
+            commit_hash="OLDER_COMMIT_HASH",
+            committed_at="2025-10-01T14:36:05+01:00",
+        )
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
 @pytest.mark.django_db
 class TestChangelogViews:
     def test_changelog_list_view(self, client, changelog_items):
@@ -312,6 +620,141 @@ class TestChangelogViews:
         assert response["object_id"] == "hrKvk/v1/functievervullingen"
         assert response["description"] == "Update table hrKvk/v1/functievervullingen."
 
+    def test_changelog_list_values(self, client, changelog_items):
+        """The list is built from query rows, with the same output as the detail view"""
+        results = client.get(reverse("changelog-list")).json()["results"]
+        assert [item["description"] for item in results] == [
+            "Update table hrKvk/v1/functievervullingen.",
+            "Create under_development dataset version civieleconstructies/v0.",
+            "Update table hrKvk/v1/functievervullingen.",
+        ]
+        for item in results:
+            detail = client.get(reverse("changelog-detail", kwargs={"pk": item["id"]}))
+            assert item == detail.json()
+
+    def test_changelog_commits(self, client, changelog_items):
+        """Commits with their items nested, paginated by commit"""
+        ChangelogItem.objects.create(
+            id=4,
+            dataset_id="hrKvk",
+            status="stable",
+            object_id="hrKvk/v1",
+            operation="status",
+            commit_hash="COMMIT_HASH_2",
+            committed_at="2026-01-02T14:36:05+01:00",
+        )
+        ChangelogItem.objects.filter(id=3).update(
+            commit_hash="COMMIT_HASH_2", committed_at="2026-01-02T14:36:05+01:00"
+        )
+
+        url = reverse("changelog-commits", query={"page_size": 1})
+        with CaptureQueriesContext(connection) as queries:
+            data = client.get(url).json()
+        # The conditional response aggregate, and the page of commits
+        assert len(queries) == 2
+        assert data["results"] == [
+            {
+                "commit_hash": "COMMIT_HASH_2",
+                "committed_at": "2026-01-02T14:36:05+01:00",
+                "items": [
+                    {
+                        "id": 3,
+                        "dataset_id": "civieleconstructies",
+                        "status": "under_development",
+                        "object_id": "civieleconstructies/v0",
+                        "operation": "create",
+                        "description": (
+                            "Create under_development dataset version civieleconstructies/v0."
+                        ),
+                    },
+                    {
+                        "id": 4,
+                        "dataset_id": "hrKvk",
+                        "status": "stable",
+                        "object_id": "hrKvk/v1",
+                        "operation": "status",
+                        "description": "Set status of dataset version hrKvk/v1 to stable.",
+                    },
+                ],
+            }
+        ]
+
+        commits = []
+        url = reverse("changelog-commits", query={"page_size": 1, "dataset_id": "hrKvk"})
+        while url:
+            data = client.get(url).json()
+            commits += [
+                (commit["committed_at"], [item["id"] for item in commit["items"]])
+                for commit in data["results"]
+            ]
+            url = data["next"]
+        assert commits == [
+            ("2026-01-02T14:36:05+01:00", [4]),
+            ("2026-01-02T14:36:05+01:00", [2]),
+            ("2025-11-04T14:36:05+01:00", [1]),
+        ]
+
+    def test_changelog_aggregates(self, client, changelog_items):
+        response = client.get(reverse("changelog-aggregates"))
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "period": "2026-01-02",
+                "dataset_id": "hrKvk",
+                "operation": "update",
+                "status": "stable",
+                "count": 1,
+            },
+            {
+                "period": "2026-01-01",
+                "dataset_id": "civieleconstructies",
+                "operation": "create",
+                "status": "under_development",
+                "count": 1,
+            },
+            {
+                "period": "2025-11-04",
+                "dataset_id": "hrKvk",
+                "operation": "update",
+                "status": "stable",
+                "count": 1,
+            },
+        ]
+
+    @pytest.mark.parametrize(
+        ["params", "expected"],
+        [
+            (
+                {"group_by": "dataset_id", "period": "month"},
+                [
+                    {"period": "2026-01-01", "dataset_id": "civieleconstructies", "count": 1},
+                    {"period": "2026-01-01", "dataset_id": "hrKvk", "count": 1},
+                    {"period": "2025-11-01", "dataset_id": "hrKvk", "count": 1},
+                ],
+            ),
+            (
+                {"group_by": "operation", "period": "week", "status": "stable"},
+                [
+                    {"period": "2025-12-29", "operation": "update", "count": 1},
+                    {"period": "2025-11-03", "operation": "update", "count": 1},
+                ],
+            ),
+            (
+                {"group_by": "", "period": "month", "from_date": "2026-01-01"},
+                [{"period": "2026-01-01", "count": 2}],
+            ),
+        ],
+    )
+    def test_changelog_aggregates_params(self, client, changelog_items, params, expected):
+        response = client.get(reverse("changelog-aggregates", query=params))
+        assert response.status_code == 200
+        assert response.json() == expected
+
+    @pytest.mark.parametrize("params", [{"group_by": "commit_hash"}, {"period": "year"}])
+    def test_changelog_aggregates_invalid(self, client, params):
+        response = client.get(reverse("changelog-aggregates", query=params))
+        assert response.status_code == 400
+
     def test_changelog_detail_view(self, client, changelog_items):
         response = client.get(
             reverse(
@@ -342,6 +785,32 @@ class TestChangelogViews:
             item_date = parse_datetime(item["committed_at"])
             assert item_date.date() >= iso_date
 
+    @pytest.mark.parametrize(
+        ["params", "expected_ids"],
+        [
+            ({"to_date": "2026-01-01"}, [3, 1]),
+            ({"to_date": "2025-12-31"}, [1]),
+            ({"from_date": "2026-01-01", "to_date": "2026-01-01"}, [3]),
+            ({"dataset_id": "hrKvk,civieleconstructies"}, [2, 3, 1]),
+            ({"dataset_id": "civieleconstructies"}, [3]),
+            ({"operation": "create"}, [3]),
+            ({"operation": "update", "status": "stable"}, [2, 1]),
+            ({"status": "under_development,stable"}, [2, 3, 1]),
+            ({"object_id": "hrKvk/v1"}, [2, 1]),
+            ({"object_id": "hrKvk/v2"}, []),
+            ({"commit_hash": "COMMIT_HASH"}, [2, 3, 1]),
+            ({"commit_hash": "OTHER_HASH"}, []),
+        ],
+    )
+    def test_changelog_list_filters(self, client, changelog_items, params, expected_ids):
+        response = client.get(reverse("changelog-list", query=params))
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["results"]] == expected_ids
+
+    def test_changelog_list_invalid_to_date(self, client, changelog_items):
+        response = client.get(reverse("changelog-list", query={"to_date": "last week"}))
+        assert response.status_code == 400
+
     def test_changelog_list_view_dataset(self, client, changelog_items):
         response = client.get(
             reverse(
@@ -373,3 +842,171 @@ class TestChangelogViews:
             assert item["dataset_id"] == "hrKvk"
             item_date = parse_datetime(item["committed_at"])
             assert item_date.date() >= iso_date
+
+    def test_changelog_list_cursor(self, client, changelog_items):
+        """
+        Cursor pagination walks from newest to oldest on (committed_at, id),
+        without skipping or repeating items that are inserted in the meantime.
+        """
+        # Same committed_at as the newest item, but a lower id
+        ChangelogItem.objects.create(
+            id=0,
+            dataset_id="hrKvk",
+            status="stable",
+            object_id="hrKvk/v1",
+            operation="status",
+            commit_hash="COMMIT_HASH",
+            committed_at="2026-01-02T14:36:05+01:00",
+        )
+
+        ids = []
+        url = reverse("changelog-list", query={"cursor": "", "page_size": 2})
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            assert response.status_code == 200
+            assert not any("COUNT(" in query["sql"] for query in queries)
+
+            data = response.json()
+            ids += [item["id"] for item in data["results"]]
+            url = data["next"]
+
+            if len(ids) == 2:
+                # Inserted while walking through the pages, before and after the cursor
+                for pk, committed_at in [
+                    (4, "2026-01-02T14:36:05+01:00"),
+                    (5, "2026-01-03T14:36:05+01:00"),
+                ]:
+                    ChangelogItem.objects.create(
+                        id=pk,
+                        dataset_id="hrKvk",
+                        status="stable",
+                        object_id="hrKvk/v1/functievervullingen",
+                        operation="update",
+                        commit_hash=f"COMMIT_HASH_{pk}",
+                        committed_at=committed_at,
+                    )
+
+                # Going back returns the items right before the next page
+                previous = client.get(url).json()["previous"]
+                assert [item["id"] for item in client.get(previous).json()["results"]] == [2, 0]
+
+        assert ids == [2, 0, 3, 1]
+
+    def test_changelog_list_cursor_invalid(self, client, changelog_items):
+        response = client.get(reverse("changelog-list", query={"cursor": "invalid"}))
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestChangelogFeed:
+    def create_item(self, pk):
+        return ChangelogItem.objects.create(
+            id=pk,
+            dataset_id="hrKvk",
+            status="stable",
+            object_id="hrKvk/v1/functievervullingen",
+            operation="update",
+            commit_hash=f"COMMIT_HASH_{pk}",
+            committed_at="2026-01-03T14:36:05+01:00",
+        )
+
+    def test_changelog_feed_resume(self, client, settings, changelog_items):
+        """Items after the Last-Event-ID are sent, then the feed closes at the deadline"""
+        settings.CHANGELOG_FEED_HEARTBEAT = 0.1
+        settings.CHANGELOG_FEED_MAX_DURATION = 0.3
+        response = client.get(reverse("changelog-feed"), headers={"Last-Event-ID": "1"})
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+
+        events = b"".join(response.streaming_content).decode().split("\n\n")
+        assert events[0].splitlines()[:2] == ["event: changelog", "id: 2"]
+        assert json.loads(events[0].splitlines()[2].removeprefix("data: "))["id"] == 2
+        assert events[1].splitlines()[1] == "id: 3"
+        assert events[2] == ": keep-alive"
+
+    @pytest.mark.django_db(transaction=True)
+    def test_changelog_feed_push(self, client, settings):
+        """New items are pushed right away, without waiting for the next heartbeat"""
+        settings.CHANGELOG_FEED_HEARTBEAT = 30
+        response = client.get(reverse("changelog-feed"))
+
+        def create_item():
+            # Like the changelog command, which commits the item in another process
+            time.sleep(0.2)
+            self.create_item(1)
+            connection.close()
+
+        thread = threading.Thread(target=create_item)
+        thread.start()
+        start = time.monotonic()
+        assert next(iter(response.streaming_content)).startswith(b"event: changelog\nid: 1\n")
+        assert time.monotonic() - start < 5
+        thread.join()
+        response.close()
+
+    def test_changelog_feed_limit(self, client, settings):
+        """Above the limit, clients are told to come back later"""
+        settings.CHANGELOG_FEED_MAX_CONNECTIONS = 1
+        settings.CHANGELOG_FEED_RETRY_AFTER = 10
+        settings.CHANGELOG_FEED_MAX_DURATION = 0
+        response = client.get(reverse("changelog-feed"))
+        assert response.status_code == 200
+
+        refused = client.get(reverse("changelog-feed"))
+        assert refused.status_code == 503
+        assert refused["Retry-After"] == "10"
+
+        # The finished feed makes room again
+        b"".join(response.streaming_content)
+        assert feed_connections.count == 0
+        response = client.get(reverse("changelog-feed"))
+        assert response.status_code == 200
+        b"".join(response.streaming_content)
+
+    def test_changelog_feed_limit_not_started(self):
+        """A feed that is closed before streaming also gives back its connection"""
+        limit = ConnectionLimit()
+        assert limit.acquire()
+        stream = FeedStream(ChangelogFeedView().stream_events(0), limit)
+        stream.close()
+        assert limit.count == 0
+
+    def test_changelog_feed_invalid_last_id(self, client):
+        response = client.get(reverse("changelog-feed"), query_params={"last_id": "x"})
+        assert response.status_code == 400
+        assert response.content.startswith(b"event: error\ndata: ")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_postgres_broker():
+    broker = PostgresBroker()
+    with broker.listen() as listener:
+        assert not listener.wait(0.1)
+        broker.notify()
+        assert listener.wait(5)
+
+
+@pytest.mark.django_db
+class TestNDJSONExport:
+    def read_lines(self, response) -> list[dict]:
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        content = b"".join(response.streaming_content)
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_dataset_export(self, client, bomen_dataset, gebieden_dataset):
+        response = client.get(reverse("dataset-list"), query_params={"_format": "ndjson"})
+        lines = self.read_lines(response)
+        assert lines == client.get(reverse("dataset-list")).json()["results"]
+
+    def test_scope_export(self, client, scope_fixture):
+        response = client.get(reverse("scope-list"), headers={"Accept": "application/x-ndjson"})
+        assert [scope["id"] for scope in self.read_lines(response)] == ["FP/MDW", "OPENBAAR"]
+
+    def test_changelog_export(self, client, changelog_items):
+        url = reverse("changelog-list")
+        response = client.get(url, query_params={"_format": "ndjson", "from_date": "2026-01-01"})
+        lines = self.read_lines(response)
+        paginated = client.get(url, query_params={"from_date": "2026-01-01"})
+        assert lines == paginated.json()["results"]